@@ -0,0 +1,130 @@
+"""
+In-process caching helpers for rarely-changing reference data and
+repeated scenario results.
+"""
+
+import asyncio
+import functools
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+# key -> (monotonic timestamp, value)
+_cache: Dict[Hashable, Tuple[float, Any]] = {}
+_locks: Dict[Hashable, asyncio.Lock] = {}
+_refreshing: Set[Hashable] = set()
+# Keep references to background refresh tasks so they are not garbage collected
+_tasks: Set[asyncio.Task] = set()
+
+
+async def cached(key: Hashable, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for key, loading it with factory() on a miss.
+
+    Entries older than ttl seconds are served stale while a single background
+    task refreshes them (stale-while-revalidate). Exceptions raised by factory
+    are propagated on a miss and never cached.
+    """
+    entry = _cache.get(key)
+    if entry is not None:
+        ts, value = entry
+        if time.monotonic() - ts >= ttl and key not in _refreshing:
+            _refreshing.add(key)
+            task = asyncio.create_task(_refresh(key, factory))
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+        return value
+
+    lock = _locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another coroutine may have filled the entry while we waited
+        entry = _cache.get(key)
+        if entry is not None:
+            return entry[1]
+        value = await factory()
+        _cache[key] = (time.monotonic(), value)
+        return value
+
+
+async def _refresh(key: Hashable, factory: Callable[[], Awaitable[Any]]) -> None:
+    """Reload a stale entry; on failure keep serving the previous value."""
+    try:
+        value = await factory()
+        _cache[key] = (time.monotonic(), value)
+    except Exception:
+        pass
+    finally:
+        _refreshing.discard(key)
+
+
+def async_ttl_cache(ttl: float = 300):
+    """Memoize an async function's results for ttl seconds, keyed on its arguments.
+
+    Entries share the cache (and stale-while-revalidate behaviour) of cached(),
+    so clear_cache() invalidates them too. Arguments must be hashable.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+            return await cached(key, ttl, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+class TTLCache:
+    """A bounded mapping whose entries expire ttl seconds after being stored.
+
+    Unlike cached(), expired entries are simply dropped (no stale serving), and
+    the least recently stored entry is evicted once maxsize is reached. Every
+    instance is also emptied by clear_cache().
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        _ttl_caches.add(self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        ts, value = entry
+        if time.monotonic() - ts >= self.ttl:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic(), value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> int:
+        count = len(self._data)
+        self._data.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_ttl_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+def clear_cache() -> int:
+    """Drop all cached entries and return how many were removed.
+
+    Used by tests and the /admin/cache/flush endpoint after reference data reloads.
+    Covers both cached() entries and every TTLCache instance.
+    """
+    count = len(_cache)
+    _cache.clear()
+    _locks.clear()
+    for ttl_cache in list(_ttl_caches):
+        count += ttl_cache.clear()
+    return count
@@ -2,37 +2,18 @@
 Configuration settings for the extended API.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
-# Attempt to load a repository-local .env file into os.environ early so that
-# BaseSettings will pick up expected values even when the process current
-# working directory differs (this happens in Codespaces / preview servers
-# which may start uvicorn from a different CWD). This avoids falling back to
-# unintended defaults such as root/no-password.
-try:
-    repo_root = Path(__file__).resolve().parents[1]
-    env_path = repo_root / '.env'
-    if env_path.exists():
-        for raw in env_path.read_text(encoding='utf-8').splitlines():
-            line = raw.strip()
-            if not line or line.startswith('#') or '=' not in line:
-                continue
-            k, v = line.split('=', 1)
-            k = k.strip()
-            v = v.strip().strip('"').strip("'")
-            # Do not overwrite existing environment variables set by the host
-            if k not in os.environ:
-                os.environ[k] = v
-        # Helpful debug print during startup
-        if 'MYSQL_USER' in os.environ:
-            print(f"[ENV LOAD] Loaded .env from {env_path} MYSQL_USER={os.environ.get('MYSQL_USER')}")
-except Exception:
-    # Never crash app startup due to .env parsing issues
-    pass
+# Resolve the repository-local .env explicitly so BaseSettings picks up
+# expected values even when the process current working directory differs
+# (this happens in Codespaces / preview servers which may start uvicorn from a
+# different CWD). This avoids falling back to unintended defaults such as
+# root/no-password. Host environment variables still take precedence.
+ENV_FILE = Path(__file__).resolve().parents[1] / '.env'
 
 
 class Settings(BaseSettings):
@@ -46,6 +27,16 @@ class Settings(BaseSettings):
     mysql_user: str = "hospital_user"
     mysql_password: str = "devpassword"
     mysql_database: str = "lm_synth"
+
+    # Connection pool settings. minsize connections are opened when the pool
+    # is created so the first requests do not pay the MySQL handshake.
+    db_pool_min: int = 10
+    db_pool_max: int = 50
+    db_pool_recycle: int = 3600
+    db_connect_timeout: int = 10
+    # Per-connection LRU of server-side prepared statements; repeated queries
+    # skip MySQL's parse step and use the binary protocol. 0 disables it.
+    db_stmt_cache_size: int = 256
     
     # API settings
     api_title: str = "Healthcare Scenarios API"
@@ -57,22 +48,35 @@ class Settings(BaseSettings):
     # CORS settings
     cors_origins: list = ["*"]
     
-    class Config:
-        env_file = ".env"
-        env_prefix = ""
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE),
+        env_file_encoding="utf-8",
+        env_prefix="",
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading .env and validating only once."""
+    s = Settings()
+
+    # Warn when running with the default root/no-password (catch common misconfigurations)
+    if s.mysql_user == 'root' and not s.mysql_password:
+        print('[CONFIG WARNING] Using root with no password for MySQL connection - this is insecure and may fail in many environments')
 
+    return s
 
-# Global settings instance
-settings = Settings()
 
-# Warn when running with the default root/no-password (catch common misconfigurations)
-if settings.mysql_user == 'root' and not settings.mysql_password:
-    print('[CONFIG WARNING] Using root with no password for MySQL connection - this is insecure and may fail in many environments')
+# Global settings instance (kept for existing `from api.config import settings` imports)
+settings = get_settings()
 
 
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
-    """Get database connection URL."""
+    """Get database connection URL (computed once; call cache_clear() after changing settings)."""
+    s = get_settings()
     return (
-        f"mysql+asyncmy://{settings.mysql_user}:{settings.mysql_password}@"
-        f"{settings.mysql_host}:{settings.mysql_port}/{settings.mysql_database}"
-    )
\ No newline at end of file
+        f"mysql+asyncmy://{s.mysql_user}:{s.mysql_password}@"
+        f"{s.mysql_host}:{s.mysql_port}/{s.mysql_database}"
+    )
@@ -2,20 +2,23 @@
 Database connection and session management.
 """
 
+import asyncio
 import asyncmy
-from asyncmy import cursors as asyncmy_cursors
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Tuple
 from contextlib import asynccontextmanager
-from .config import settings
+from .config import get_settings
 
 
 # Database connection pool
 _connection_pool = None
+# Serializes lazy pool creation so concurrent first requests create one pool
+_init_lock = asyncio.Lock()
 
 
 async def init_db():
     """Initialize database connection pool."""
     global _connection_pool
+    settings = get_settings()
     # Log the connection parameters (avoid logging passwords in real prod)
     print(f"[DB INIT] Connecting to MySQL at {settings.mysql_host}:{settings.mysql_port} as user={settings.mysql_user}")
     _connection_pool = await asyncmy.create_pool(
@@ -26,8 +29,11 @@ async def init_db():
         db=settings.mysql_database,
         charset='utf8mb4',
         autocommit=True,
-        maxsize=10,
-        minsize=1
+        maxsize=settings.db_pool_max,
+        minsize=settings.db_pool_min,
+        pool_recycle=settings.db_pool_recycle,
+        connect_timeout=settings.db_connect_timeout,
+        stmt_cache_size=settings.db_stmt_cache_size
     )
 
 
@@ -43,8 +49,12 @@ async def close_db():
 @asynccontextmanager
 async def get_db_connection():
     """Get database connection from pool."""
-    if not _connection_pool:
-        await init_db()
+    # The pool is normally created in the app lifespan; this is a fallback
+    # for scripts and tests that use the repositories directly.
+    if _connection_pool is None:
+        async with _init_lock:
+            if _connection_pool is None:
+                await init_db()
     
     connection = await _connection_pool.acquire()
     try:
@@ -53,28 +63,43 @@ async def get_db_connection():
         _connection_pool.release(connection)
 
 
+def _connection_cursor(conn):
+    """Return the cursor reused for every query on a pooled connection.
+
+    A pooled connection serves one coroutine at a time, so sharing its cursor
+    needs no lock and saves allocating and closing a cursor per query.
+    """
+    cursor = getattr(conn, '_api_cursor', None)
+    if cursor is None:
+        cursor = conn._api_cursor = conn.cursor()
+    return cursor
+
+
 async def execute_query(query: str, params=None) -> list:
     """Execute a SELECT query and return results."""
+    _, rows = await execute_query_rows(query, params)
+    return rows
+
+
+async def execute_query_rows(query: str, params=None) -> Tuple[Tuple[str, ...], list]:
+    """Execute a SELECT query and return (column names, rows as tuples)."""
     async with get_db_connection() as conn:
-        cursor = await conn.cursor()
+        # The default cursor returns plain tuples; column names are read once
+        # from cursor.description instead of being hashed into every row.
+        cursor = _connection_cursor(conn)
         try:
             await cursor.execute(query, params or ())
-            result = await cursor.fetchall()
-            return result
-        finally:
+            rows = await cursor.fetchall()
+        except Exception:
+            # Do not reuse a cursor left in an unknown state
+            conn._api_cursor = None
             await cursor.close()
+            raise
+        columns = tuple(d[0] for d in cursor.description or ())
+        return columns, rows
 
 
 async def execute_query_dict(query: str, params=None) -> list:
     """Execute a SELECT query and return results as dictionaries."""
-    async with get_db_connection() as conn:
-        # asyncmy exposes cursor classes under asyncmy.cursors
-        # When passing a cursor class, conn.cursor may return a cursor object directly
-        # so do not await it.
-        cursor = conn.cursor(cursor=asyncmy_cursors.DictCursor)
-        try:
-            await cursor.execute(query, params or ())
-            result = await cursor.fetchall()
-            return result
-        finally:
-            await cursor.close()
\ No newline at end of file
+    columns, rows = await execute_query_rows(query, params)
+    return [dict(zip(columns, row)) for row in rows]
@@ -2,26 +2,37 @@
 Main FastAPI application for healthcare scenarios API.
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Body, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from contextlib import asynccontextmanager
 import os
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 
-from .config import settings
+from .config import get_settings
 from .db import init_db, close_db
+from .cache import cached, clear_cache
 from .repositories import ReferenceRepository
 from .services import ScenarioService
 from .schemas import (
     ApiResponse, PaginatedResponse, ScenarioRequest, ScenarioResponse,
     ErrorResponse
 )
-import json
+import asyncio
+import hashlib
+import inspect
+import aiofiles
+import orjson
 from pathlib import Path
+import re
 import uuid
 from datetime import datetime
 
 
+# Resolve settings once at import; get_settings() is cached per process.
+settings = get_settings()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
@@ -52,18 +63,81 @@ app = FastAPI(
 # Repository root (use this rather than Path.cwd() so file operations are consistent
 # even when the process current working directory differs, e.g., Codespaces preview)
 REPO_ROOT = Path(__file__).resolve().parents[1]
+SAVES_DIR = REPO_ROOT / 'saved_scenarios'
+# One JSON line per saved scenario ({id, saved_at, path}) so listing does not
+# have to open and parse every save file.
+MANIFEST_PATH = SAVES_DIR / 'manifest.jsonl'
+_manifest_lock = asyncio.Lock()
+
+
+async def _write_json(path: Path, content: dict) -> None:
+    """Write content as indented UTF-8 JSON without blocking the event loop."""
+    async with aiofiles.open(path, 'wb') as fh:
+        await fh.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+
 
+async def _read_json(path: Path) -> dict:
+    """Read a JSON file without blocking the event loop."""
+    async with aiofiles.open(path, 'rb') as fh:
+        return orjson.loads(await fh.read())
+
+
+async def _rebuild_manifest() -> list:
+    """Rebuild the manifest from the save files on disk (caller holds _manifest_lock)."""
+    paths = await asyncio.to_thread(lambda: sorted(SAVES_DIR.glob('scenario_*.json')))
+    entries = []
+    for p in paths:
+        try:
+            content = await _read_json(p)
+        except Exception:
+            # skip malformed files
+            continue
+        # Labelled saves have no id and are served by /scenarios/labels
+        if content.get('id'):
+            entries.append({'id': content['id'], 'saved_at': content.get('saved_at'), 'path': str(p)})
+    entries.sort(key=lambda e: e['saved_at'] or '')
+
+    async with aiofiles.open(MANIFEST_PATH, 'wb') as fh:
+        await fh.write(b''.join(orjson.dumps(e) + b'\n' for e in entries))
+    return entries
+
+
+async def _append_manifest(entry: dict) -> None:
+    """Record a new save in the manifest, creating it from disk if missing."""
+    async with _manifest_lock:
+        if not await asyncio.to_thread(MANIFEST_PATH.exists):
+            # The save file is already written, so the rebuild includes it
+            await _rebuild_manifest()
+            return
+        async with aiofiles.open(MANIFEST_PATH, 'ab') as fh:
+            await fh.write(orjson.dumps(entry) + b'\n')
+
+
+async def _read_manifest() -> list:
+    """Return manifest entries in save order."""
+    async with _manifest_lock:
+        try:
+            async with aiofiles.open(MANIFEST_PATH, 'rb') as fh:
+                raw = await fh.read()
+        except FileNotFoundError:
+            return await _rebuild_manifest()
 
+    entries = []
+    for line in raw.splitlines():
+        try:
+            entries.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    return entries
+
+
+# NOTE: Only register these diagnostic endpoints in debug mode to avoid
+# leaking configuration details (and unauthenticated cache flushes) in
+# non-development environments.
 if settings.debug:
     @app.get('/debug/db')
     async def debug_db():
         """Return effective DB connection info (debug only)."""
-
-        # NOTE: Only expose this diagnostic endpoint in debug mode to avoid
-        # leaking configuration details in non-development environments.
-        if not getattr(settings, 'debug', False):
-            raise HTTPException(status_code=404, detail='Not found')
-
         return {
             'mysql_host': settings.mysql_host,
             'mysql_port': settings.mysql_port,
@@ -73,18 +147,41 @@ if settings.debug:
             'env_mysql_password_set': bool(os.getenv('MYSQL_PASSWORD'))
         }
 
+    @app.post('/admin/cache/flush', response_model=ApiResponse)
+    async def flush_cache():
+        """Drop cached reference data and scenario results (debug only).
+
+        Caches are per process: with several workers (WEB_CONCURRENCY) only
+        the worker that handles this request is flushed.
+        """
+        flushed = clear_cache()
+        return ApiResponse(data={'flushed': flushed}, meta={'count': flushed})
+
 
 # Add CORS middleware
 # Configure CORS. When allow_origins contains '*' we must not set allow_credentials=True
 # because browsers will reject Access-Control-Allow-Origin='*' with credentials.
-allow_credentials = True
-if isinstance(settings.cors_origins, list) and len(settings.cors_origins) == 1 and settings.cors_origins[0] == '*':
-    allow_credentials = False
+_ALLOW_CREDENTIALS = not (isinstance(settings.cors_origins, list) and settings.cors_origins == ['*'])
+
+# Probe and info endpoints are never called cross-origin from the frontend, so
+# they bypass the CORS middleware entirely (liveness probes hit /health often).
+CORS_EXEMPT_PATHS = frozenset({"/health", "/"})
+
+
+class _ProbeExemptCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that passes CORS_EXEMPT_PATHS straight to the app."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in CORS_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 app.add_middleware(
-    CORSMiddleware,
+    _ProbeExemptCORSMiddleware,
     allow_origins=settings.cors_origins,
-    allow_credentials=allow_credentials,
+    allow_credentials=_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -93,78 +190,135 @@ app.add_middleware(
 ref_repo = ReferenceRepository()
 scenario_service = ScenarioService()
 
-
-# Reference endpoints
-@app.get("/reference/sites", response_model=ApiResponse)
-async def get_sites():
-    """Get all hospital sites."""
-    try:
-        sites = await ref_repo.get_sites()
-        return ApiResponse(data=sites, meta={"count": len(sites)})
-    except Exception as e:
-        # In dev/test environments the database may be unavailable.
-        # Return an empty list so the frontend can still render and show an informative state.
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
-
-
-@app.get("/reference/programs", response_model=ApiResponse)
-async def get_programs():
-    """Get all healthcare programs."""
-    try:
-        programs = await ref_repo.get_programs()
-        return ApiResponse(data=programs, meta={"count": len(programs)})
-    except Exception as e:
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
+# Read-heavy GET endpoints build their ApiResponse themselves, so they skip
+# FastAPI's response_model re-validation and only document the schema.
+API_RESPONSE_DOC = {200: {"model": ApiResponse}}
+
+# Reference data changes rarely; serve it from memory and refresh in the background
+REFERENCE_DIM_TTL = 600  # sites, programs
+REFERENCE_DATA_TTL = 120  # beds, baselines, seasonality, staffing factors
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): any listed tag, or '*'."""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(',')]
+    return '*' in tags or etag in (t[2:] if t.startswith('W/') else t for t in tags)
+
+
+async def _cached_reference(request: Request, key, ttl: float, loader, **meta) -> Response:
+    """Serve a reference payload from the cache as pre-serialized JSON bytes.
+
+    The ApiResponse is dumped in JSON mode (Decimal -> str, as FastAPI would)
+    once per refresh, so cache hits skip validation and serialization. The
+    ETag is hashed from the same bytes; clients revalidating with a matching
+    If-None-Match get an empty 304.
+    """
+    async def build() -> Tuple[str, bytes]:
+        data = await loader()
+        body = orjson.dumps(ApiResponse(data=data, meta={"count": len(data), **meta}).model_dump(mode='json'))
+        return f'"{hashlib.md5(body).hexdigest()}"', body
+
+    etag, body = await cached(key, ttl, build)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={int(ttl)}"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Reference endpoints: (path, repository method, TTL, query parameter, docstring).
+# The query parameter, when present, is (name, type, Query(...)); its value is
+# passed to the repository method and echoed in the response meta.
+REFERENCE_ENDPOINTS = (
+    ("/reference/sites", "get_sites", REFERENCE_DIM_TTL, None,
+     "Get all hospital sites."),
+    ("/reference/programs", "get_programs", REFERENCE_DIM_TTL, None,
+     "Get all healthcare programs."),
+    ("/reference/staffed-beds", "get_staffed_beds", REFERENCE_DATA_TTL,
+     ("schedule", str, Query("Sched-A", description="Schedule code")),
+     "Get staffed beds by schedule."),
+    ("/reference/baselines", "get_clinical_baselines", REFERENCE_DATA_TTL,
+     ("year", int, Query(2022, description="Baseline year")),
+     "Get clinical baselines by year."),
+    ("/reference/seasonality", "get_seasonality", REFERENCE_DATA_TTL,
+     ("year", int, Query(2022, description="Reference year (for context)")),
+     "Get seasonality multipliers."),
+    ("/reference/staffing-factors", "get_staffing_factors", REFERENCE_DATA_TTL, None,
+     "Get staffing factors for FTE calculations."),
+)
 
 
-@app.get("/reference/staffed-beds", response_model=ApiResponse)
-async def get_staffed_beds(
+def _make_reference_handler(method: str, ttl: float, param, doc: str):
+    """Build a GET handler that serves ref_repo.<method> through the cache."""
+    async def handler(request: Request, **query):
+        # Look the method up per call so tests can monkeypatch ref_repo
+        loader = getattr(ref_repo, method)
+        try:
+            return await _cached_reference(
+                request, (method, *query.values()), ttl,
+                lambda: loader(*query.values()), **query
+            )
+        except Exception as e:
+            # In dev/test environments the database may be unavailable.
+            # Return an empty list so the frontend can still render and show an informative state.
+            return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
+
+    params = [inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)]
+    if param is not None:
+        name, annotation, default = param
+        params.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY,
+                                        default=default, annotation=annotation))
+    # FastAPI reads query parameters from the signature
+    handler.__signature__ = inspect.Signature(params)
+    handler.__doc__ = doc
+    return handler
+
+
+for _path, _method, _ttl, _param, _doc in REFERENCE_ENDPOINTS:
+    app.add_api_route(
+        _path, _make_reference_handler(_method, _ttl, _param, _doc),
+        methods=["GET"], response_model=None, responses=API_RESPONSE_DOC, name=_method
+    )
+
+
+@app.get("/reference/bootstrap", response_model=None, responses=API_RESPONSE_DOC)
+async def get_reference_bootstrap(
+    request: Request,
+    year: int = Query(2022, description="Baseline / reference year"),
     schedule: str = Query("Sched-A", description="Schedule code")
 ):
-    """Get staffed beds by schedule."""
-    try:
-        beds = await ref_repo.get_staffed_beds(schedule)
-        return ApiResponse(data=beds, meta={"count": len(beds), "schedule": schedule})
-    except Exception as e:
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
-
-
-@app.get("/reference/baselines", response_model=ApiResponse)
-async def get_baselines(
-    year: int = Query(2022, description="Baseline year")
-):
-    """Get clinical baselines by year."""
-    try:
-        baselines = await ref_repo.get_clinical_baselines(year)
-        return ApiResponse(data=baselines, meta={"count": len(baselines), "year": year})
-    except Exception as e:
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
-
-
-@app.get("/reference/seasonality", response_model=ApiResponse)
-async def get_seasonality(
-    year: int = Query(2022, description="Reference year (for context)")
-):
-    """Get seasonality multipliers."""
-    try:
-        seasonality = await ref_repo.get_seasonality(year)
-        return ApiResponse(data=seasonality, meta={"count": len(seasonality), "year": year})
-    except Exception as e:
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
-
+    """Get all reference data in one response (one round trip on page load)."""
+    async def load():
+        # Independent queries run concurrently on separate pool connections
+        sites, programs, beds, baselines, seasonality, factors = await asyncio.gather(
+            ref_repo.get_sites(),
+            ref_repo.get_programs(),
+            ref_repo.get_staffed_beds(schedule),
+            ref_repo.get_clinical_baselines(year),
+            ref_repo.get_seasonality(year),
+            ref_repo.get_staffing_factors(),
+        )
+        return {
+            "sites": sites,
+            "programs": programs,
+            "staffed_beds": beds,
+            "baselines": baselines,
+            "seasonality": seasonality,
+            "staffing_factors": factors,
+        }
 
-@app.get("/reference/staffing-factors", response_model=ApiResponse)
-async def get_staffing_factors():
-    """Get staffing factors for FTE calculations."""
     try:
-        factors = await ref_repo.get_staffing_factors()
-        return ApiResponse(data=factors, meta={"count": len(factors)})
+        return await _cached_reference(
+            request, ('bootstrap', year, schedule), REFERENCE_DATA_TTL, load,
+            year=year, schedule=schedule
+        )
     except Exception as e:
-        return ApiResponse(data=[], meta={"count": 0, "error": str(e)})
+        return ApiResponse(data={}, meta={"count": 0, "error": str(e)})
 
 
 # Scenario calculation endpoint
-@app.post("/scenarios/compute", response_model=ScenarioResponse)
+@app.post("/scenarios/compute", response_model=None, responses={200: {"model": ScenarioResponse}})
 async def compute_scenario(request: ScenarioRequest):
     """Compute scenario results with KPIs and site-level details."""
     try:
@@ -175,9 +329,13 @@ async def compute_scenario(request: ScenarioRequest):
         if request.params.occupancy_target < 0.80:
             raise HTTPException(status_code=400, detail="Occupancy target must be >= 0.80")
         
-        # Calculate scenario
+        # Calculate scenario; the service builds a typed ScenarioResponse, so
+        # serialize it straight to bytes instead of re-validating it. Plain
+        # mappings (e.g. from substitute services) are still validated.
         result = await scenario_service.calculate_scenario(request)
-        return result
+        if not isinstance(result, ScenarioResponse):
+            result = ScenarioResponse.model_validate(result)
+        return Response(content=orjson.dumps(result.model_dump()), media_type="application/json")
         
     except HTTPException:
         raise
@@ -190,12 +348,11 @@ async def compute_scenario(request: ScenarioRequest):
 async def save_scenario_endpoint(payload: dict):
     """Save a scenario payload to disk and return a save id."""
     try:
-        saves_dir = REPO_ROOT / "saved_scenarios"
-        saves_dir.mkdir(parents=True, exist_ok=True)
+        SAVES_DIR.mkdir(parents=True, exist_ok=True)
 
         save_id = uuid.uuid4().hex
         timestamp = datetime.utcnow().isoformat()
-        filename = saves_dir / f"scenario_{save_id}.json"
+        filename = SAVES_DIR / f"scenario_{save_id}.json"
 
         content = {
             "id": save_id,
@@ -203,8 +360,8 @@ async def save_scenario_endpoint(payload: dict):
             "payload": payload,
         }
 
-        with filename.open("w", encoding="utf-8") as fh:
-            json.dump(content, fh, ensure_ascii=False, indent=2)
+        await _write_json(filename, content)
+        await _append_manifest({"id": save_id, "saved_at": timestamp, "path": str(filename)})
 
         return ApiResponse(data={"id": save_id, "path": str(filename)})
     except Exception as e:
@@ -212,15 +369,14 @@ async def save_scenario_endpoint(payload: dict):
 
 
 @app.post('/scenarios/save-label', response_model=ApiResponse)
-async def save_scenario_label(label: str = Query(..., description='Label for saved scenario (A/B/C)'), payload: dict = None):
+async def save_scenario_label(
+    label: Literal['A', 'B', 'C'] = Query(..., description='Label for saved scenario (A/B/C)'),
+    payload: dict = Body(...)
+):
     """Save a scenario under a label (A, B, or C). Overwrites existing labelled saves."""
     try:
-        if label not in ('A', 'B', 'C'):
-            raise HTTPException(status_code=400, detail='Label must be A, B, or C')
-
-        saves_dir = REPO_ROOT / 'saved_scenarios'
-        saves_dir.mkdir(parents=True, exist_ok=True)
-        filename = saves_dir / f'scenario_label_{label}.json'
+        SAVES_DIR.mkdir(parents=True, exist_ok=True)
+        filename = SAVES_DIR / f'scenario_label_{label}.json'
 
         content = {
             'label': label,
@@ -228,32 +384,25 @@ async def save_scenario_label(label: str = Query(..., description='Label for sav
             'payload': payload,
         }
 
-        with filename.open('w', encoding='utf-8') as fh:
-            json.dump(content, fh, ensure_ascii=False, indent=2)
+        await _write_json(filename, content)
 
         return ApiResponse(data={'label': label, 'path': str(filename)})
-    except HTTPException:
-        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Save-label error: {str(e)}")
 
 
-@app.get('/scenarios/labels', response_model=ApiResponse)
+@app.get('/scenarios/labels', response_model=None, responses=API_RESPONSE_DOC)
 async def list_labeled_scenarios():
     """Return labelled scenarios A/B/C (dev/demo)."""
     try:
-        saves_dir = REPO_ROOT / 'saved_scenarios'
         result = {}
         for label in ('A', 'B', 'C'):
-            p = saves_dir / f'scenario_label_{label}.json'
-            if p.exists():
-                try:
-                    with p.open('r', encoding='utf-8') as fh:
-                        content = json.load(fh)
-                    result[label] = content.get('payload')
-                except Exception:
-                    result[label] = None
-            else:
+            p = SAVES_DIR / f'scenario_label_{label}.json'
+            try:
+                content = await _read_json(p)
+                result[label] = content.get('payload')
+            except Exception:
+                # missing or malformed label file
                 result[label] = None
 
         return ApiResponse(data=result, meta={'count': 3})
@@ -261,81 +410,109 @@ async def list_labeled_scenarios():
         raise HTTPException(status_code=500, detail=f'List-labels error: {str(e)}')
 
 
-@app.get("/scenarios/saved", response_model=ApiResponse)
+@app.get("/scenarios/saved", response_model=None, responses=API_RESPONSE_DOC)
 async def list_saved_scenarios():
-    """List saved scenarios from disk (dev/demo only)."""
+    """List saved scenarios (id, saved_at, path) from the manifest (dev/demo only).
+
+    Payloads are not included; fetch them with GET /scenarios/saved/{save_id}.
+    """
     try:
-        saves_dir = REPO_ROOT / "saved_scenarios"
-        if not saves_dir.exists():
+        if not SAVES_DIR.exists():
             return ApiResponse(data=[], meta={"count": 0})
 
-        entries = []
-        for p in sorted(saves_dir.glob('scenario_*.json')):
-            try:
-                with p.open('r', encoding='utf-8') as fh:
-                    content = json.load(fh)
-                entries.append({
-                    'id': content.get('id'),
-                    'saved_at': content.get('saved_at'),
-                    'payload': content.get('payload')
-                })
-            except Exception:
-                # skip malformed files
-                continue
-
+        entries = await _read_manifest()
         return ApiResponse(data=entries, meta={"count": len(entries)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"List error: {str(e)}")
 
 
+@app.get("/scenarios/saved/{save_id}", response_model=None, responses=API_RESPONSE_DOC)
+async def get_saved_scenario(save_id: str):
+    """Return a single saved scenario including its payload (dev/demo only)."""
+    # Save ids are uuid4 hex strings; rejecting anything else also prevents path traversal
+    if not re.fullmatch(r'[0-9a-f]{32}', save_id):
+        raise HTTPException(status_code=404, detail='Saved scenario not found')
+    try:
+        content = await _read_json(SAVES_DIR / f'scenario_{save_id}.json')
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail='Saved scenario not found')
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Load error: {str(e)}")
+
+    return ApiResponse(data={
+        'id': content.get('id'),
+        'saved_at': content.get('saved_at'),
+        'payload': content.get('payload')
+    })
+
+
+def _clear_saves_dir() -> int:
+    """Remove every file in SAVES_DIR and return the number of saves deleted."""
+    deleted = 0
+    with os.scandir(SAVES_DIR) as it:
+        for entry in it:
+            # Match the previous glob('*') semantics: leave dotfiles alone
+            if entry.name.startswith('.'):
+                continue
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                # skip files we cannot remove
+                continue
+            if entry.name != MANIFEST_PATH.name:
+                deleted += 1
+    return deleted
+
+
 @app.post('/scenarios/reset', response_model=ApiResponse)
 async def reset_saved_scenarios():
     """Delete all saved scenarios from disk (dev/demo only)."""
     try:
-        saves_dir = REPO_ROOT / 'saved_scenarios'
-        if not saves_dir.exists():
+        if not SAVES_DIR.exists():
             return ApiResponse(data={'deleted': 0}, meta={'count': 0})
 
-        deleted = 0
-        for p in list(saves_dir.glob('*')):
-            try:
-                p.unlink()
-                deleted += 1
-            except Exception:
-                # skip files we cannot remove
-                continue
+        # Unlink on a worker thread (under the manifest lock) so a large
+        # directory does not block the event loop
+        async with _manifest_lock:
+            deleted = await asyncio.to_thread(_clear_saves_dir)
 
         return ApiResponse(data={'deleted': deleted}, meta={'count': deleted})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Reset error: {str(e)}")
 
 
+# Static payloads for the health and root endpoints, serialized once at import
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "healthcare-scenarios-api"})
+_ROOT_BYTES = orjson.dumps({
+    "message": "Healthcare Scenarios API",
+    "version": settings.api_version,
+    "docs": "/docs",
+    "endpoints": {
+        "reference": {
+            "sites": "/reference/sites",
+            "programs": "/reference/programs",
+            "staffed_beds": "/reference/staffed-beds",
+            "baselines": "/reference/baselines",
+            "seasonality": "/reference/seasonality",
+            "staffing_factors": "/reference/staffing-factors",
+            "bootstrap": "/reference/bootstrap"
+        },
+        "scenarios": {
+            "compute": "/scenarios/compute"
+        }
+    }
+})
+
+
 # Health check
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "healthcare-scenarios-api"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/")
 async def root():
     """API root with endpoint information."""
-    return {
-        "message": "Healthcare Scenarios API",
-        "version": settings.api_version,
-        "docs": "/docs",
-        "endpoints": {
-            "reference": {
-                "sites": "/reference/sites",
-                "programs": "/reference/programs", 
-                "staffed_beds": "/reference/staffed-beds",
-                "baselines": "/reference/baselines",
-                "seasonality": "/reference/seasonality",
-                "staffing_factors": "/reference/staffing-factors"
-            },
-            "scenarios": {
-                "compute": "/scenarios/compute"
-            }
-        }
-    }
\ No newline at end of file
+    return Response(content=_ROOT_BYTES, media_type="application/json")
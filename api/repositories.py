@@ -2,13 +2,118 @@
 Repository layer for database queries.
 """
 
-from typing import List, Optional, Dict, Any
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from .cache import async_ttl_cache
 from .db import execute_query_dict
 from .schemas import (
     Site, Program, Subprogram, StaffedBedsSchedule, 
     ClinicalBaseline, SeasonalityMonthly, StaffingFactor
 )
 
+# Reference tables change rarely; memoize the scenario-input lookups for this
+# many seconds. Lookups behind the /reference endpoints are not memoized here,
+# since main.py already caches those responses.
+REFERENCE_CACHE_TTL = 300
+
+
+def _id_params(ids: List[int]) -> List[int]:
+    """Return ids de-duplicated, sorted and coerced to int for an IN (...) clause."""
+    return sorted({int(i) for i in ids})
+
+
+@lru_cache(maxsize=256)
+def _in_query(template: str, site_count: int, program_count: int = 0) -> str:
+    """Render template's {site_ids} / {program_ids} lists with '%s' placeholders.
+
+    The rendered text only depends on how many distinct ids are bound, and
+    the same string object is returned for repeat calls, so the connection's
+    prepared-statement cache (keyed on SQL text) is reused across requests.
+    """
+    return template.format(
+        site_ids=', '.join(['%s'] * site_count),
+        program_ids=', '.join(['%s'] * program_count),
+    )
+
+
+# Scenario queries filtered by bound lists of site (and program) ids; see _in_query
+_SQL_BASELINE_ADMISSIONS = """
+    SELECT 
+        ip.facility_id as site_id,
+        COUNT(*) as admissions_base,
+        AVG(ip.los_days) as los_observed,
+        AVG(ip.alc_flag) as alc_rate_observed
+    FROM ip_stays ip
+    WHERE ip.facility_id IN ({site_ids})
+      AND ip.program_id = %s
+      AND ip.admit_ts >= %s
+      AND ip.admit_ts < %s
+    GROUP BY ip.facility_id
+    ORDER BY ip.facility_id
+"""
+
+_SQL_SITE_PROGRAM_BASELINE = """
+    SELECT 
+        c.site_id, c.program_id, c.baseline_year,
+        c.los_base_days, c.alc_rate,
+        ds.site_code, ds.site_name
+    FROM clinical_baseline c
+    JOIN dim_site ds ON c.site_id = ds.site_id
+    WHERE c.site_id IN ({site_ids})
+      AND c.program_id = %s
+      AND c.baseline_year = %s
+    ORDER BY c.site_id
+"""
+
+_SQL_SITE_PROGRAM_INPUTS = """
+    SELECT
+        c.site_id, c.program_id, c.baseline_year,
+        c.los_base_days, c.alc_rate, s.staffed_beds,
+        ds.site_code, ds.site_name
+    FROM clinical_baseline c
+    JOIN staffed_beds_schedule s
+      ON s.site_id = c.site_id
+     AND s.program_id = c.program_id
+     AND s.schedule_code = %s
+    JOIN dim_site ds ON c.site_id = ds.site_id
+    WHERE c.site_id IN ({site_ids})
+      AND c.program_id IN ({program_ids})
+      AND c.baseline_year = %s
+    ORDER BY c.program_id, c.site_id
+"""
+
+_SQL_MONTHLY_SEASONALITY_BY_SITE = """
+    SELECT ds.site_id, m.month,
+           COALESCE(sp.multiplier, p.multiplier, g.multiplier, 1.0) AS multiplier
+    FROM dim_site ds
+    CROSS JOIN (
+        SELECT 1 AS month UNION ALL SELECT 2 UNION ALL SELECT 3
+        UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6
+        UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9
+        UNION ALL SELECT 10 UNION ALL SELECT 11 UNION ALL SELECT 12
+    ) m
+    LEFT JOIN seasonality_monthly sp
+           ON sp.site_id = ds.site_id AND sp.program_id = %s AND sp.month = m.month
+    LEFT JOIN seasonality_monthly p
+           ON p.site_id IS NULL AND p.program_id = %s AND p.month = m.month
+    LEFT JOIN seasonality_monthly g
+           ON g.site_id IS NULL AND g.program_id IS NULL AND g.month = m.month
+    WHERE ds.site_id IN ({site_ids})
+    ORDER BY ds.site_id, m.month
+"""
+
+_SQL_SITE_STAFFED_BEDS = """
+    SELECT s.site_id, s.program_id, s.staffed_beds,
+           ds.site_code, ds.site_name
+    FROM staffed_beds_schedule s
+    JOIN dim_site ds ON s.site_id = ds.site_id
+    WHERE s.site_id IN ({site_ids})
+      AND s.program_id = %s
+      AND s.schedule_code = %s
+    ORDER BY s.site_id
+"""
+
 
 class ReferenceRepository:
     """Repository for reference data queries."""
@@ -112,22 +217,17 @@ class ScenarioRepository:
         baseline_year: int
     ) -> List[Dict[str, Any]]:
         """Get baseline admissions from historical data."""
-        site_ids_str = ','.join(map(str, site_ids))
-        
-        query = f"""
-            SELECT 
-                ip.facility_id as site_id,
-                COUNT(*) as admissions_base,
-                AVG(ip.los_days) as los_observed,
-                AVG(CASE WHEN ip.alc_flag=1 THEN 1 ELSE 0 END) as alc_rate_observed
-            FROM ip_stays ip
-            WHERE ip.facility_id IN ({site_ids_str})
-              AND ip.program_id = %s
-              AND YEAR(ip.admit_ts) = %s
-            GROUP BY ip.facility_id
-            ORDER BY ip.facility_id
-        """
-        return await execute_query_dict(query, [program_id, baseline_year])
+        if not site_ids:
+            return []
+        site_params = _id_params(site_ids)
+        query = _in_query(_SQL_BASELINE_ADMISSIONS, len(site_params))
+        # A half-open range on admit_ts (instead of YEAR(admit_ts) = year)
+        # lets MySQL use idx_ip_prog_admit
+        year_start = date(baseline_year, 1, 1)
+        year_end = date(baseline_year + 1, 1, 1)
+        return await execute_query_dict(
+            query, [*site_params, program_id, year_start, year_end]
+        )
     
     @staticmethod
     async def get_site_program_baseline(
@@ -136,21 +236,33 @@ class ScenarioRepository:
         baseline_year: int
     ) -> List[Dict[str, Any]]:
         """Get baseline clinical parameters for sites and program."""
-        site_ids_str = ','.join(map(str, site_ids))
-        
-        query = f"""
-            SELECT 
-                c.site_id, c.program_id, c.baseline_year,
-                c.los_base_days, c.alc_rate,
-                ds.site_code, ds.site_name
-            FROM clinical_baseline c
-            JOIN dim_site ds ON c.site_id = ds.site_id
-            WHERE c.site_id IN ({site_ids_str})
-              AND c.program_id = %s
-              AND c.baseline_year = %s
-            ORDER BY c.site_id
+        if not site_ids:
+            return []
+        site_params = _id_params(site_ids)
+        query = _in_query(_SQL_SITE_PROGRAM_BASELINE, len(site_params))
+        return await execute_query_dict(query, [*site_params, program_id, baseline_year])
+    
+    @staticmethod
+    async def get_site_program_inputs(
+        site_ids: List[int],
+        program_ids: List[int],
+        baseline_year: int,
+        schedule_code: str = "Sched-A"
+    ) -> List[Dict[str, Any]]:
+        """Get baseline parameters and staffed beds for sites and programs in one query.
+
+        Only (site, program) pairs with both a clinical baseline and a
+        staffed-beds row are returned, which are the pairs a scenario can
+        project.
         """
-        return await execute_query_dict(query, [program_id, baseline_year])
+        if not site_ids or not program_ids:
+            return []
+        site_params = _id_params(site_ids)
+        program_params = _id_params(program_ids)
+        query = _in_query(_SQL_SITE_PROGRAM_INPUTS, len(site_params), len(program_params))
+        return await execute_query_dict(
+            query, [schedule_code, *site_params, *program_params, baseline_year]
+        )
     
     @staticmethod
     async def get_site_staffed_beds(
@@ -159,21 +271,14 @@ class ScenarioRepository:
         schedule_code: str = "Sched-A"
     ) -> List[Dict[str, Any]]:
         """Get staffed beds for sites and program."""
-        site_ids_str = ','.join(map(str, site_ids))
-        
-        query = f"""
-            SELECT s.site_id, s.program_id, s.staffed_beds,
-                   ds.site_code, ds.site_name
-            FROM staffed_beds_schedule s
-            JOIN dim_site ds ON s.site_id = ds.site_id
-            WHERE s.site_id IN ({site_ids_str})
-              AND s.program_id = %s
-              AND s.schedule_code = %s
-            ORDER BY s.site_id
-        """
-        return await execute_query_dict(query, [program_id, schedule_code])
+        if not site_ids:
+            return []
+        site_params = _id_params(site_ids)
+        query = _in_query(_SQL_SITE_STAFFED_BEDS, len(site_params))
+        return await execute_query_dict(query, [*site_params, program_id, schedule_code])
     
     @staticmethod
+    @async_ttl_cache(ttl=REFERENCE_CACHE_TTL)
     async def get_staffing_factor(program_id: int) -> Optional[Dict[str, Any]]:
         """Get staffing factors for a program."""
         query = """
@@ -185,40 +290,51 @@ class ScenarioRepository:
         results = await execute_query_dict(query, [program_id])
         return results[0] if results else None
     
+    @staticmethod
+    @async_ttl_cache(ttl=REFERENCE_CACHE_TTL)
+    async def get_monthly_seasonality_by_site(
+        site_ids: Tuple[int, ...],
+        program_id: int
+    ) -> Dict[int, List[float]]:
+        """Get the 12 monthly multipliers for several sites of one program in one query.
+
+        Each month resolves the same fallback ladder as get_seasonality_multiplier
+        (site+program, then program, then global, then 1.0) inside the query.
+        site_ids is a tuple so the result can be memoized; sites missing from
+        dim_site are omitted.
+        """
+        if not site_ids:
+            return {}
+        site_params = _id_params(site_ids)
+        query = _in_query(_SQL_MONTHLY_SEASONALITY_BY_SITE, len(site_params))
+        results = await execute_query_dict(query, [program_id, program_id, *site_params])
+        by_site: Dict[int, List[float]] = {}
+        for r in results:
+            by_site.setdefault(r['site_id'], []).append(float(r['multiplier']))
+        return by_site
+    
     @staticmethod
     async def get_seasonality_multiplier(
         site_id: Optional[int] = None,
         program_id: Optional[int] = None,
         month: int = 1
     ) -> float:
-        """Get seasonality multiplier for specific site/program/month."""
-        # Try specific site/program first
-        if site_id and program_id:
-            query = """
-                SELECT multiplier FROM seasonality_monthly
-                WHERE site_id = %s AND program_id = %s AND month = %s
-                LIMIT 1
-            """
-            results = await execute_query_dict(query, [site_id, program_id, month])
-            if results:
-                return float(results[0]['multiplier'])
-        
-        # Try program-specific
-        if program_id:
-            query = """
-                SELECT multiplier FROM seasonality_monthly
-                WHERE site_id IS NULL AND program_id = %s AND month = %s
-                LIMIT 1
-            """
-            results = await execute_query_dict(query, [program_id, month])
-            if results:
-                return float(results[0]['multiplier'])
-        
-        # Fall back to global
+        """Get seasonality multiplier for specific site/program/month.
+
+        Resolves the fallback ladder (site+program, then program, then global,
+        then 1.0) in a single query by ranking the candidate rows.
+        """
+        # Falsy ids skip their level, as with the previous sequential lookups
+        site_id = site_id if site_id and program_id else None
+        program_id = program_id or None
         query = """
             SELECT multiplier FROM seasonality_monthly
-            WHERE site_id IS NULL AND program_id IS NULL AND month = %s
+            WHERE month = %s
+              AND ((site_id = %s AND program_id = %s)
+                   OR (site_id IS NULL AND program_id = %s)
+                   OR (site_id IS NULL AND program_id IS NULL))
+            ORDER BY (site_id IS NOT NULL) DESC, (program_id IS NOT NULL) DESC
             LIMIT 1
         """
-        results = await execute_query_dict(query, [month])
-        return float(results[0]['multiplier']) if results else 1.0
\ No newline at end of file
+        results = await execute_query_dict(query, [month, site_id, program_id, program_id])
+        return float(results[0]['multiplier']) if results else 1.0
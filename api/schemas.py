@@ -5,7 +5,7 @@ Pydantic schemas for the extended API.
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 from pydantic import model_validator
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 
@@ -124,6 +124,9 @@ class ScenarioRequest(BaseModel):
 
 class SiteResult(BaseModel):
     """Results for a single site."""
+    # Built by ScenarioService with model_construct(); never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     site_id: int
     site_code: str
     site_name: str
@@ -139,6 +142,9 @@ class SiteResult(BaseModel):
 
 class ScenarioKPIs(BaseModel):
     """Aggregate scenario KPIs."""
+    # Built by ScenarioService with model_construct(); never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     total_required_beds: int
     total_staffed_beds: int
     total_capacity_gap: int
@@ -150,6 +156,9 @@ class ScenarioKPIs(BaseModel):
 
 class ScenarioResponse(BaseModel):
     """Response for scenario calculation."""
+    # Built by ScenarioService with model_construct(); never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     kpis: ScenarioKPIs
     by_site: List[SiteResult]
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -3,11 +3,32 @@ Business logic service layer for scenario calculations.
 Implements the compute model from the specification.
 """
 
-import math
-from typing import List, Dict, Any, Optional
+import asyncio
+import numpy as np
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from .cache import TTLCache
 from .repositories import ScenarioRepository, ReferenceRepository
 from .schemas import ScenarioRequest, ScenarioResponse, ScenarioKPIs, SiteResult
 
+# Response metadata that does not depend on the request
+_STATIC_METADATA = {
+    "calculation_date": "2025-01-01",  # Would be datetime.now() in real implementation
+    "model_version": "1.0"
+}
+
+# Identical scenario requests (dashboard reloads, background refreshes) are
+# answered from memory for this long; /admin/cache/flush (debug mode) empties the cache.
+SCENARIO_CACHE_TTL = 60
+SCENARIO_CACHE_SIZE = 1024
+
+
+class _Pair(NamedTuple):
+    """A (site, program) combination with both a baseline and staffed beds."""
+    pos: int  # position of the site in request.sites
+    site_id: int
+    program_id: int
+    row: Dict[str, Any]  # joined baseline/staffed-beds row
+
 
 class ScenarioService:
     """Service for scenario calculations."""
@@ -15,106 +36,107 @@ class ScenarioService:
     def __init__(self):
         self.scenario_repo = ScenarioRepository()
         self.ref_repo = ReferenceRepository()
+        self._response_cache = TTLCache(maxsize=SCENARIO_CACHE_SIZE, ttl=SCENARIO_CACHE_TTL)
     
     async def calculate_scenario(self, request: ScenarioRequest) -> ScenarioResponse:
-        """Calculate scenario results for given parameters."""
+        """Calculate scenario results for given parameters.
+
+        Responses are frozen, so one computed for an identical request (same
+        JSON serialization) within SCENARIO_CACHE_TTL seconds is returned as is.
+        """
+        key = request.model_dump_json()
+        response = self._response_cache.get(key)
+        if response is None:
+            response = await self._compute_scenario(request)
+            self._response_cache.set(key, response)
+        return response
+
+    async def _compute_scenario(self, request: ScenarioRequest) -> ScenarioResponse:
+        """Compute scenario results from the repositories."""
         
         # Normalize program ids (request.program_ids ensured by schema validator)
         program_ids = getattr(request, 'program_ids', [request.program_id]) or [request.program_id]
 
         # Fetch data for all program_ids and aggregate where appropriate
-        baselines = []
-        staffed_beds = []
         historical_admissions = []
         staffing_factors = {}
 
-        for pid in program_ids:
-            b = await self.scenario_repo.get_site_program_baseline(request.sites, pid, request.baseline_year)
-            baselines.extend(b or [])
-
-            sb = await self.scenario_repo.get_site_staffed_beds(request.sites, pid, request.params.schedule_code)
-            staffed_beds.extend(sb or [])
+        # Baselines joined with staffed beds come back for every program in
+        # one query. Admissions and staffing factors are still per program;
+        # all lookups are independent, so they run concurrently and results
+        # are consumed in program_ids order.
+        site_inputs, per_program = await asyncio.gather(
+            self.scenario_repo.get_site_program_inputs(
+                request.sites, program_ids, request.baseline_year, request.params.schedule_code
+            ),
+            asyncio.gather(*(
+                asyncio.gather(
+                    self.scenario_repo.get_baseline_admissions(request.sites, pid, request.baseline_year),
+                    self.scenario_repo.get_staffing_factor(pid),
+                )
+                for pid in program_ids
+            )),
+        )
+        site_inputs = site_inputs or []
 
-            ha = await self.scenario_repo.get_baseline_admissions(request.sites, pid, request.baseline_year)
+        for pid, (ha, sf) in zip(program_ids, per_program):
             historical_admissions.extend(ha or [])
-
-            sf = await self.scenario_repo.get_staffing_factor(pid)
             if sf:
                 staffing_factors[pid] = sf
         
-        # Calculate results for each site
-        site_results = []
-        total_required_beds = 0
-        total_staffed_beds = 0
-        total_admissions = 0
-        total_patient_days = 0
-        overall_total_fte = 0.0 if staffing_factors else None
-        
-        for site_id in request.sites:
-            per_program_results = []
-            total_staffed_for_site = 0
-            total_required = 0
-            total_adm = 0
-            total_days = 0
-            site_total_fte = 0.0
-            fte_count = 0
+        # Index fetched rows by (site_id, program_id); the first row wins, as
+        # with the previous per-site list scans.
+        def index_rows(rows: List[Dict]) -> Dict[tuple, Dict]:
+            index = {}
+            for row in rows:
+                index.setdefault((row.get('site_id'), row.get('program_id')), row)
+            return index
+
+        inputs_idx = index_rows(site_inputs)
+        admissions_idx = index_rows(historical_admissions)
 
+        # Collect the (site, program) pairs that have both a baseline and a
+        # staffed-beds row (the joined inputs); others produce no result.
+        pairs: List[_Pair] = []
+        for pos, site_id in enumerate(request.sites):
             for pid in program_ids:
-                sf = staffing_factors.get(pid)
-                b = [x for x in baselines if x.get('site_id') == site_id and x.get('program_id') == pid]
-                sb = [x for x in staffed_beds if x.get('site_id') == site_id and x.get('program_id') == pid]
-                ha = [x for x in historical_admissions if x.get('site_id') == site_id and x.get('program_id') == pid]
-
-                class _Req:
-                    pass
-                pr = _Req()
-                pr.sites = [site_id]
-                pr.program_id = pid
-                pr.program_ids = program_ids
-                pr.baseline_year = request.baseline_year
-                pr.horizon_years = request.horizon_years
-                pr.params = request.params
-
-                site_res = await self._calculate_site_result(site_id, pr, b, sb, ha, sf)
-                if site_res:
-                    per_program_results.append(site_res)
-                    total_required += site_res.required_beds
-                    total_staffed_for_site += site_res.staffed_beds
-                    total_adm += site_res.admissions_projected
-                    total_days += site_res.patient_days
-                    if site_res.nursing_fte:
-                        site_total_fte += site_res.nursing_fte
-                        fte_count += 1
-
-            if not per_program_results:
-                continue
-
-            aggregated = SiteResult(
-                site_id=site_id,
-                site_code=per_program_results[0].site_code,
-                site_name=per_program_results[0].site_name,
-                admissions_projected=total_adm,
-                los_effective=round(sum(r.los_effective for r in per_program_results) / len(per_program_results), 2),
-                patient_days=total_days,
-                census_average=round(total_days / 365.0, 1),
-                required_beds=total_required,
-                staffed_beds=total_staffed_for_site,
-                capacity_gap=total_required - total_staffed_for_site,
-                nursing_fte=round(site_total_fte, 1) if fte_count > 0 else None
-            )
-
-            site_results.append(aggregated)
-            total_required_beds += aggregated.required_beds
-            total_staffed_beds += aggregated.staffed_beds
-            total_admissions += aggregated.admissions_projected
-            total_patient_days += aggregated.patient_days
-            if aggregated.nursing_fte:
-                overall_total_fte = (overall_total_fte or 0) + aggregated.nursing_fte
-
-        avg_occupancy = total_patient_days / (total_staffed_beds * 365) if total_staffed_beds > 0 else 0
-        avg_los_effective = total_patient_days / total_admissions if total_admissions > 0 else 0
-
-        kpis = ScenarioKPIs(
+                site_row = inputs_idx.get((site_id, pid))
+                if site_row:
+                    pairs.append(_Pair(pos, site_id, pid, site_row))
+
+        seasonality = None
+        if request.params.seasonality:
+            # One lookup per program covers all of its distinct sites; repeated
+            # sites in the request reuse the same average. Kept local to the
+            # call because the service instance is shared across requests.
+            sites_by_pid: Dict[int, set] = {}
+            for pair in pairs:
+                sites_by_pid.setdefault(pair.program_id, set()).add(pair.site_id)
+            averages = await asyncio.gather(*(
+                self._get_average_seasonality(tuple(sorted(sites)), pid)
+                for pid, sites in sites_by_pid.items()
+            ))
+            by_pid = dict(zip(sites_by_pid, averages))
+            seasonality = [by_pid[pair.program_id][pair.site_id] for pair in pairs]
+
+        projection = _project_pairs(request, pairs, admissions_idx, staffing_factors, seasonality)
+        site_results = _aggregate_sites(request.sites, pairs, projection)
+
+        overall_total_fte = 0.0 if staffing_factors else None
+        for site_res in site_results:
+            if site_res.nursing_fte:
+                overall_total_fte = (overall_total_fte or 0) + site_res.nursing_fte
+
+        # KPI totals are plain integer sums over every projected pair
+        total_required_beds = int(projection['required_beds'].sum())
+        total_staffed_beds = int(projection['staffed_beds'].sum())
+        total_admissions = int(projection['admissions_projected'].sum())
+        total_patient_days = int(projection['patient_days'].sum())
+
+        avg_occupancy = total_patient_days / (total_staffed_beds * 365) if total_staffed_beds > 0 else 0.0
+        avg_los_effective = total_patient_days / total_admissions if total_admissions > 0 else 0.0
+
+        kpis = ScenarioKPIs.model_construct(
             total_required_beds=total_required_beds,
             total_staffed_beds=total_staffed_beds,
             total_capacity_gap=total_required_beds - total_staffed_beds,
@@ -124,100 +146,169 @@ class ScenarioService:
             avg_los_effective=round(avg_los_effective, 2)
         )
 
-        return ScenarioResponse(
+        return ScenarioResponse.model_construct(
             kpis=kpis,
             by_site=site_results,
-            metadata={
-                "request_params": request.model_dump(),
-                "calculation_date": "2025-01-01",  # Would be datetime.now() in real implementation
-                "model_version": "1.0"
-            }
+            metadata={"request_params": request.model_dump(), **_STATIC_METADATA}
         )
     
-    async def _calculate_site_result(
-        self,
-        site_id: int,
-        request: ScenarioRequest,
-        baselines: List[Dict],
-        staffed_beds: List[Dict],
-        historical_admissions: List[Dict], 
-        staffing_factor: Optional[Dict]
-    ) -> Optional[SiteResult]:
-        """Calculate results for a single site."""
-        # Find baseline data for this site
-        site_baseline = next((b for b in baselines if b['site_id'] == site_id), None)
-        if not site_baseline:
-            return None
-
-        # Find staffed beds for this site
-        site_beds = next((s for s in staffed_beds if s['site_id'] == site_id), None)
-        if not site_beds:
-            return None
-
-        # Find historical admissions (fallback if not available)
-        site_admissions = next((a for a in historical_admissions if a['site_id'] == site_id), None)
-        baseline_admissions = site_admissions['admissions_base'] if site_admissions else 100
-
-        # Extract parameters and coerce numeric types
-        g = float(request.params.growth_pct)
-        y = int(request.horizon_years)
-        d = float(request.params.los_delta)
-        occ_t = float(request.params.occupancy_target)
-        alc_t = float(request.params.alc_target)
-        alc_b = float(site_baseline.get('alc_rate', 0))
-        los_b = float(site_baseline.get('los_base_days', 1.0))
-
-        # Calculate projections
-        admissions_projected = int(baseline_admissions * ((1 + g) ** y))
-        los_acute = los_b * (1 + d)
-        los_effective = los_acute * (1 + (alc_t - alc_b))
-
-        # Apply bounds/guards
-        los_effective = max(0.25, los_effective)
-
-        # Get seasonality multiplier (using average of year)
-        seasonality_factor = 1.0
-        if request.params.seasonality:
-            seasonality_factor = await self._get_average_seasonality(site_id, request.program_id)
+    async def _get_average_seasonality(
+        self, 
+        site_ids: Tuple[int, ...], 
+        program_id: int
+    ) -> Dict[int, float]:
+        """Calculate each site's average seasonality factor across all months.
+
+        Every pair site comes from a row joined with dim_site, so the bulk
+        lookup returns all of them.
+        """
+        by_site = await self.scenario_repo.get_monthly_seasonality_by_site(site_ids, program_id)
+        return {site_id: sum(multipliers) / 12 for site_id, multipliers in by_site.items()}
+
+
+def _project_pairs(
+    request: ScenarioRequest,
+    pairs: List[_Pair],
+    admissions_idx: Dict[tuple, Dict],
+    staffing_factors: Dict[int, Dict],
+    seasonality: Optional[List[float]]
+) -> Dict[str, np.ndarray]:
+    """Project every (site, program) pair at once with NumPy.
+
+    The arithmetic follows the same operation order as the scalar
+    model so results are identical. Returns unrounded per-pair arrays;
+    _aggregate_sites applies Python's round() when building SiteResults.
+    """
+    n = len(pairs)
+
+    # Extract parameters and coerce numeric types
+    g = float(request.params.growth_pct)
+    y = int(request.horizon_years)
+    # Loop-invariant compound growth, evaluated once for every pair
+    growth_factor = (1 + g) ** y
+    d = float(request.params.los_delta)
+    occ_t = float(request.params.occupancy_target)
+    alc_t = float(request.params.alc_target)
 
-        patient_days = int(admissions_projected * los_effective * seasonality_factor)
-        census_average = patient_days / 365.0
-        required_beds = math.ceil(census_average / occ_t) if occ_t > 0 else 0
+    base_adm = np.empty(n)
+    los_b = np.empty(n)
+    alc_b = np.empty(n)
+    hppd = np.zeros(n)
+    fte_denominator = np.zeros(n)
+    has_factor = np.zeros(n, dtype=bool)
 
-        # Calculate nursing FTE if staffing factors available
-        nursing_fte = None
+    for i, (_, site_id, pid, site_row) in enumerate(pairs):
+        # Historical admissions (fallback if not available)
+        site_admissions = admissions_idx.get((site_id, pid))
+        base_adm[i] = site_admissions['admissions_base'] if site_admissions else 100
+        alc_b[i] = float(site_row.get('alc_rate', 0))
+        los_b[i] = float(site_row.get('los_base_days', 1.0))
+
+        staffing_factor = staffing_factors.get(pid)
         if staffing_factor:
-            hppd = float(staffing_factor.get('hppd', 0))
+            has_factor[i] = True
+            hppd[i] = float(staffing_factor.get('hppd', 0))
             annual_hours = float(staffing_factor.get('annual_hours_per_fte', 1950))
             productivity = float(staffing_factor.get('productivity_factor', 1.0))
+            fte_denominator[i] = annual_hours * productivity
+
+    # Calculate projections
+    admissions_projected = (base_adm * growth_factor).astype(np.int64)
+    los_acute = los_b * (1 + d)
+    # Apply bounds/guards
+    los_effective = np.maximum(0.25, los_acute * (1 + (alc_t - alc_b)))
+
+    seasonality_factor = np.asarray(seasonality, dtype=float) if seasonality is not None else np.ones(n)
+    patient_days = (admissions_projected * los_effective * seasonality_factor).astype(np.int64)
+    census_average = patient_days / 365.0
+    if occ_t > 0:
+        required_beds = np.ceil(census_average / occ_t).astype(np.int64)
+    else:
+        required_beds = np.zeros(n, dtype=np.int64)
+
+    # Nursing FTE where staffing factors are available
+    total_hours_needed = required_beds * hppd * 365
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nursing_fte = total_hours_needed / fte_denominator
+    has_fte = has_factor & (fte_denominator > 0)
+
+    return {
+        'staffed_beds': np.array(
+            [int(pair.row.get('staffed_beds', 0)) for pair in pairs], dtype=np.int64
+        ),
+        'admissions_projected': admissions_projected,
+        'los_effective': los_effective,
+        'patient_days': patient_days,
+        'required_beds': required_beds,
+        'nursing_fte': nursing_fte,
+        'has_fte': has_fte,
+    }
 
-            total_hours_needed = required_beds * hppd * 365
-            nursing_fte = round(total_hours_needed / (annual_hours * productivity), 1) if (annual_hours * productivity) > 0 else None
 
-        return SiteResult(
+def _aggregate_sites(
+    sites: List[int],
+    pairs: List[_Pair],
+    projection: Dict[str, np.ndarray]
+) -> List[SiteResult]:
+    """Combine per-pair projections into one SiteResult per requested site.
+
+    Sums are accumulated per request position with np.add.at, which adds in
+    pair order, so float totals match the previous sequential loop. Pair
+    values are rounded with Python's round() first, as they were when each
+    pair had its own SiteResult.
+    """
+    n_sites = len(sites)
+    pos = np.fromiter((pair.pos for pair in pairs), dtype=np.intp, count=len(pairs))
+
+    los_rounded = np.array([round(float(v), 2) for v in projection['los_effective']])
+    fte_rounded = np.array([
+        round(float(v), 1) if has else 0.0
+        for v, has in zip(projection['nursing_fte'], projection['has_fte'])
+    ])
+    # Pairs without FTE, or with 0.0 FTE, do not count towards the site's FTE
+    fte_counted = fte_rounded != 0.0
+
+    def per_site(values: np.ndarray) -> np.ndarray:
+        totals = np.zeros(n_sites, dtype=values.dtype)
+        np.add.at(totals, pos, values)
+        return totals
+
+    counts = np.bincount(pos, minlength=n_sites)
+    admissions = per_site(projection['admissions_projected'])
+    patient_days = per_site(projection['patient_days'])
+    required = per_site(projection['required_beds'])
+    staffed = per_site(projection['staffed_beds'])
+    los_sum = per_site(los_rounded)
+    fte_sum = per_site(np.where(fte_counted, fte_rounded, 0.0))
+    fte_count = per_site(fte_counted.astype(np.int64))
+
+    # Site code/name come from the site's first projected pair
+    first_row: Dict[int, Dict] = {}
+    for pair in pairs:
+        first_row.setdefault(pair.pos, pair.row)
+
+    # Values are computed here rather than taken from user input, so the
+    # models are built with model_construct() (no per-field validation);
+    # everything passed in must already have the field's type.
+    site_results = []
+    for i, site_id in enumerate(sites):
+        if not counts[i]:
+            continue
+        site_row = first_row[i]
+        total_days = int(patient_days[i])
+        total_required = int(required[i])
+        total_staffed = int(staffed[i])
+        site_results.append(SiteResult.model_construct(
             site_id=site_id,
-            site_code=site_baseline.get('site_code', ''),
-            site_name=site_baseline.get('site_name', ''),
-            admissions_projected=admissions_projected,
-            los_effective=round(los_effective, 2),
-            patient_days=patient_days,
-            census_average=round(census_average, 1),
-            required_beds=required_beds,
-            staffed_beds=site_beds.get('staffed_beds', 0),
-            capacity_gap=required_beds - site_beds.get('staffed_beds', 0),
-            nursing_fte=nursing_fte
-        )
-    
-    async def _get_average_seasonality(
-        self, 
-        site_id: int, 
-        program_id: int
-    ) -> float:
-        """Calculate average seasonality factor across all months."""
-        total = 0.0
-        for month in range(1, 13):
-            multiplier = await self.scenario_repo.get_seasonality_multiplier(
-                site_id, program_id, month
-            )
-            total += multiplier
-        return total / 12
\ No newline at end of file
+            site_code=site_row.get('site_code', ''),
+            site_name=site_row.get('site_name', ''),
+            admissions_projected=int(admissions[i]),
+            los_effective=round(float(los_sum[i]) / int(counts[i]), 2),
+            patient_days=total_days,
+            census_average=round(total_days / 365.0, 1),
+            required_beds=total_required,
+            staffed_beds=total_staffed,
+            capacity_gap=total_required - total_staffed,
+            nursing_fte=round(float(fte_sum[i]), 1) if fte_count[i] > 0 else None
+        ))
+    return site_results
@@ -5,7 +5,7 @@ Implements instruction 00: Config & Pydantic models for data validation and API
 
 from datetime import date, datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -52,10 +52,16 @@ class Disposition(str, Enum):
     LEFT_WITHOUT_BEING_SEEN = "LWBS"
 
 
+# Records are built once from source rows and only read afterwards
+_RECORD_CONFIG = ConfigDict(frozen=True)
+
+
 # Dimension Models (Instruction 01)
 
 class DimSite(BaseModel):
     """Hospital facility dimension."""
+    model_config = _RECORD_CONFIG
+
     site_id: int = Field(..., description="Unique facility identifier")
     site_code: str = Field(..., description="Facility code (e.g., LM-SNW)")
     site_name: str = Field(..., description="Facility name")
@@ -64,6 +70,8 @@ class DimSite(BaseModel):
 
 class DimProgram(BaseModel):
     """Healthcare program dimension."""
+    model_config = _RECORD_CONFIG
+
     program_id: int = Field(..., description="Unique program identifier")
     program_name: str = Field(..., description="Program name (e.g., Medicine, Surgery)")
     program_category: str = Field(default="Clinical", description="Program category")
@@ -71,6 +79,8 @@ class DimProgram(BaseModel):
 
 class DimSubprogram(BaseModel):
     """Healthcare subprogram dimension."""
+    model_config = _RECORD_CONFIG
+
     subprogram_id: int = Field(..., description="Unique subprogram identifier")
     program_id: int = Field(..., description="Parent program identifier")
     subprogram_name: str = Field(..., description="Subprogram name")
@@ -78,6 +88,8 @@ class DimSubprogram(BaseModel):
 
 class DimLHA(BaseModel):
     """Local Health Area dimension."""
+    model_config = _RECORD_CONFIG
+
     lha_id: int = Field(..., description="Unique LHA identifier")
     lha_name: str = Field(..., description="LHA name (e.g., Harborview)")
     default_site_id: int = Field(..., description="Default facility for this LHA")
@@ -87,6 +99,8 @@ class DimLHA(BaseModel):
 
 class PopulationProjection(BaseModel):
     """Population projection data."""
+    model_config = _RECORD_CONFIG
+
     year: int = Field(..., description="Projection year")
     lha_id: int = Field(..., description="Local Health Area identifier")
     age_group: AgeGroup = Field(..., description="Age group")
@@ -96,6 +110,8 @@ class PopulationProjection(BaseModel):
 
 class EDBaselineRate(BaseModel):
     """Emergency Department baseline utilization rates."""
+    model_config = _RECORD_CONFIG
+
     lha_id: int = Field(..., description="Local Health Area identifier")
     age_group: AgeGroup = Field(..., description="Age group")
     gender: Gender = Field(..., description="Gender")
@@ -107,6 +123,8 @@ class EDBaselineRate(BaseModel):
 
 class Patient(BaseModel):
     """Patient demographic information."""
+    model_config = _RECORD_CONFIG
+
     patient_id: str = Field(..., description="Unique patient identifier")
     dob: date = Field(..., description="Date of birth")
     age_group: AgeGroup = Field(..., description="Age group category")
@@ -119,6 +137,8 @@ class Patient(BaseModel):
 
 class EDEncounter(BaseModel):
     """Emergency Department encounter."""
+    model_config = _RECORD_CONFIG
+
     encounter_id: int = Field(..., description="Unique encounter identifier")
     patient_id: str = Field(..., description="Patient identifier")
     facility_id: int = Field(..., description="Facility where encounter occurred")
@@ -130,6 +150,8 @@ class EDEncounter(BaseModel):
 
 class IPStay(BaseModel):
     """Inpatient stay record."""
+    model_config = _RECORD_CONFIG
+
     stay_id: int = Field(..., description="Unique stay identifier")
     patient_id: str = Field(..., description="Patient identifier")
     facility_id: int = Field(..., description="Facility identifier")
@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Send a command to a running CLI daemon (python cli.py daemon) instead of
+# starting the full CLI. The client below only imports the standard library.
+# Usage: ./cli-fast.sh generate --patients 100
+#        ./cli-fast.sh validate --data-dir ./data
+#        ./cli-fast.sh shutdown
+# Set SYNTHHC_SOCKET to use a socket other than /tmp/synthhc.sock.
+
+set -e
+
+SOCKET="${SYNTHHC_SOCKET:-/tmp/synthhc.sock}"
+
+if [ $# -lt 1 ]; then
+    echo "Usage: $0 <generate|validate|status|shutdown> [args...]"
+    exit 1
+fi
+
+if [ ! -S "$SOCKET" ]; then
+    echo "❌ No CLI daemon on $SOCKET. Start one with: python cli.py daemon"
+    exit 1
+fi
+
+exec python3 -S -c '
+import json, socket, sys
+sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+sock.connect(sys.argv[1])
+with sock, sock.makefile("rwb") as stream:
+    stream.write(json.dumps({"cmd": sys.argv[2], "args": sys.argv[3:]}).encode() + b"\n")
+    stream.flush()
+    reply = json.loads(stream.readline())
+sys.stdout.write(reply["output"])
+sys.exit(reply["exit_code"])
+' "$SOCKET" "$@"
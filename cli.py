@@ -9,20 +9,23 @@ import os
 import sys
 import subprocess
 import json
+import contextlib
+import csv
+import http.client
+import io
+import stat
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict
-from rich.console import Console
+from typing import Callable, Optional, List, Dict, Tuple
+from rich.console import Console, Group
 from rich.table import Table
-from rich.progress import track, Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.text import Text
-from rich.align import Align
-from rich.columns import Columns
-from rich.syntax import Syntax
-import pandas as pd
-import platform
+from rich.progress import track, Progress
 import shutil
+# pyarrow is imported inside the functions that need it: it dominates start-up
+# time and most commands (help, serve, status) never use it.
 
 # Initialize typer app and rich console
 app = typer.Typer(help="Synthetic Healthcare Data CLI")
@@ -32,7 +35,55 @@ console = Console()
 DATA_DIR = Path("./data")
 DEFAULT_PATIENTS = 1000
 DEFAULT_SEED = 42
-SUPPORTED_FORMATS = ["csv", "parquet", "json"]
+SUPPORTED_FORMATS = ("csv", "parquet", "json")  # display order
+_SUPPORTED_FORMATS_SET = frozenset(SUPPORTED_FORMATS)
+
+# Files written by generate_data.py that validation expects
+REQUIRED_FILES = [
+    "dim_site.csv", "dim_program.csv", "dim_subprogram.csv", "dim_lha.csv",
+    "population_projection.csv", "ed_baseline_rates.csv",
+    "patients.csv", "ed_encounters.csv", "ip_stays.csv"
+]
+
+# Per-file validation results, reused while a file's size and mtime are unchanged.
+# Bump the version whenever the checks in validate_data_file change.
+VALIDATION_CACHE = Path("./cache/validation.json")
+VALIDATION_CACHE_VERSION = 2
+
+# Files at least this large are row-counted through a memory map
+MMAP_COUNT_THRESHOLD = 100 * 1024 * 1024
+# Threads counting memory-mapped windows; bounds the NumPy temporaries in flight
+MMAP_COUNT_WORKERS = 4
+
+# Column types of the files written by generate_data.py, so full CSV parses
+# skip type inference. Timestamps stay strings, as they are in the CSVs.
+CSV_DTYPES: Dict[str, Dict[str, str]] = {
+    "dim_site.csv": {"site_code": "str", "site_name": "str"},
+    "dim_program.csv": {"program_id": "int64", "program_name": "str"},
+    "dim_subprogram.csv": {"program_id": "int64", "subprogram_id": "int64", "subprogram_name": "str"},
+    "dim_lha.csv": {"lha_name": "str", "default_site_id": "int64"},
+    "population_projection.csv": {
+        "year": "int64", "lha_id": "int64", "age_group": "str", "gender": "str", "population": "int64",
+    },
+    "ed_baseline_rates.csv": {
+        "lha_id": "int64", "age_group": "str", "gender": "str", "ed_subservice": "str",
+        "baserate_per_1000": "float64",
+    },
+    "patients.csv": {
+        "patient_id": "str", "lha_id": "int64", "facility_home_id": "int64", "age_group": "str",
+        "gender": "str", "dob": "str", "primary_ed_subservice": "str", "expected_ed_rate": "float64",
+        "ed_visits_year": "int64",
+    },
+    "ed_encounters.csv": {
+        "encounter_id": "int64", "patient_id": "str", "facility_id": "int64", "ed_subservice": "str",
+        "arrival_ts": "str", "acuity": "int64", "dispo": "str",
+    },
+    "ip_stays.csv": {
+        "stay_id": "int64", "patient_id": "str", "facility_id": "int64", "program_id": "int64",
+        "subprogram_id": "int64", "admit_ts": "str", "discharge_ts": "str", "los_days": "float64",
+        "alc_flag": "int64",
+    },
+}
 
 
 @app.command()
@@ -45,6 +96,7 @@ def generate(
     with_ip: bool = typer.Option(True, "--with-ip/--no-ip", help="Generate IP stays"),
     start_year: int = typer.Option(2025, "--start-year", help="Start year for projections"),
     years: int = typer.Option(10, "--years", help="Number of years to project"),
+    isolated: bool = typer.Option(False, "--isolated", help="Run the generator in a separate Python process"),
 ):
     """Generate synthetic healthcare data."""
     
@@ -54,7 +106,7 @@ def generate(
     console.print(f"Format: {format}")
     console.print(f"Output: {output_dir}")
     
-    if format not in SUPPORTED_FORMATS:
+    if format not in _SUPPORTED_FORMATS_SET:
         console.print(f"[red]Error: Unsupported format '{format}'. Supported formats: {', '.join(SUPPORTED_FORMATS)}[/red]")
         raise typer.Exit(1)
     
@@ -62,23 +114,34 @@ def generate(
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
     try:
-        # Run the data generation script
-        cmd = [
-            sys.executable, "generate_data.py",
+        # Arguments for the data generation script
+        argv = [
             "--patients", str(patients),
             "--seed", str(seed),
             "--output", output_dir
         ]
         
         if not with_ed:
-            cmd.append("--no-ed")
+            argv.append("--no-ed")
         if not with_ip:
-            cmd.append("--no-ip")
-            
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            argv.append("--no-ip")
+        
+        if isolated:
+            cmd = [sys.executable, "generate_data.py", *argv]
+            run_streaming(cmd)
+        else:
+            # In-process: skips interpreter start-up and re-importing pandas/numpy.
+            # The script's progress output is discarded, as with capture_output.
+            from generate_data import main as generate_main
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_main(argv)
         
         console.print("[green]✓ Data generation completed successfully[/green]")
         
+        if format == "parquet":
+            convert_csv_to_parquet(output_dir)
+            console.print("[green]✓ Wrote Parquet copies of the CSV files[/green]")
+        
         # Show summary of generated files
         show_data_summary(output_dir)
         
@@ -90,6 +153,10 @@ def generate(
         raise typer.Exit(1)
 
 
+# Whether the SDV validation script is present; it does not change while the CLI runs
+_SDV_VALIDATE = Path("sdv_models/validate.py").is_file()
+
+
 @app.command()
 def validate(
     data_dir: str = typer.Option("./data", "--data-dir", "-d", help="Data directory to validate"),
@@ -100,25 +167,38 @@ def validate(
     
     console.print(f"[bold blue]Validating data in {data_dir}...[/bold blue]")
     
-    if not Path(data_dir).exists():
+    try:
+        is_dir = stat.S_ISDIR(os.stat(data_dir).st_mode)
+    except FileNotFoundError:
         console.print(f"[red]Error: Data directory '{data_dir}' does not exist[/red]")
         raise typer.Exit(1)
+    if not is_dir:
+        console.print(f"[red]Error: '{data_dir}' is not a directory[/red]")
+        raise typer.Exit(1)
     
     try:
         # Check if validation script exists
-        if Path("sdv_models/validate.py").exists():
+        if _SDV_VALIDATE:
             # Use SDV validation if available
-            cmd = [
-                sys.executable, "sdv_models/validate.py",
+            argv = [
                 "--real-data-dir", data_dir,
                 "--synthetic-data-dir", f"{data_dir}/synthetic"
             ]
             if strict:
-                cmd.append("--strict")
+                argv.append("--strict")
             if output:
-                cmd.extend(["--output", output])
-                
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                argv.extend(["--output", output])
+            
+            try:
+                from sdv_models.validate import main as sdv_main
+            except ImportError:
+                # Its dependencies may only be available to a different setup
+                run_streaming([sys.executable, "sdv_models/validate.py", *argv])
+            else:
+                # In-process: no interpreter start-up or pandas/numpy re-import
+                if sdv_main(argv):
+                    console.print("[red]Validation failed: validation thresholds not met[/red]")
+                    raise typer.Exit(1)
             console.print("[green]✓ SDV validation completed[/green]")
             
         else:
@@ -130,18 +210,74 @@ def validate(
             
             # Save to file if requested
             if output:
-                with open(output, 'w') as f:
-                    json.dump(validation_results, f, indent=2, default=str)
+                write_json_report(Path(output), validation_results)
                 console.print(f"[green]✓ Validation report saved to {output}[/green]")
         
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Validation failed: {e.stderr}[/red]")
         raise typer.Exit(1)
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Validation error: {str(e)}[/red]")
         raise typer.Exit(1)
 
 
+@app.command()
+def pipeline(
+    patients: int = typer.Option(DEFAULT_PATIENTS, "--patients", "-p", help="Number of patients to generate"),
+    seed: int = typer.Option(DEFAULT_SEED, "--seed", "-s", help="Random seed for reproducibility"),
+    output_dir: str = typer.Option("./data", "--output", "-o", help="Output directory"),
+    with_ed: bool = typer.Option(True, "--with-ed/--no-ed", help="Generate ED encounters"),
+    with_ip: bool = typer.Option(True, "--with-ip/--no-ip", help="Generate IP stays"),
+    report: Optional[str] = typer.Option(None, "--report", "-r", help="Save validation report to file"),
+):
+    """Generate data and validate it in one process.
+    
+    Each file is validated on a worker thread as soon as it is written, while
+    the next one is generated.
+    """
+    
+    console.print(f"[bold green]Generating and validating data in {output_dir}...[/bold green]")
+    
+    argv = ["--patients", str(patients), "--seed", str(seed), "--output", output_dir]
+    if not with_ed:
+        argv.append("--no-ed")
+    if not with_ip:
+        argv.append("--no-ip")
+    
+    try:
+        from generate_data import generate_iter
+        
+        futures = {}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The generator's progress output is discarded, as in generate
+            with contextlib.redirect_stdout(io.StringIO()):
+                for path, _ in generate_iter(argv):
+                    filename = os.path.basename(path)
+                    if filename in REQUIRED_FILES:
+                        futures[filename] = executor.submit(validate_data_file, Path(path), filename)
+            file_results = {filename: future.result() for filename, future in futures.items()}
+        
+        # Required files the generator skipped (--no-ed/--no-ip) are checked on disk
+        for filename in REQUIRED_FILES:
+            if filename not in file_results:
+                data_file, st = select_data_file(Path(output_dir) / filename)
+                file_results[filename] = validate_data_file(data_file if st else None, filename)
+        
+        console.print("[green]✓ Data generation completed successfully[/green]")
+        validation_results = summarize_validation(output_dir, file_results)
+        display_validation_results(validation_results)
+        
+        if report:
+            write_json_report(Path(report), validation_results)
+            console.print(f"[green]✓ Validation report saved to {report}[/green]")
+    
+    except Exception as e:
+        console.print(f"[red]Pipeline error: {str(e)}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def serve(
     host: str = typer.Option("localhost", "--host", "-h", help="Host to bind to"),
@@ -155,11 +291,11 @@ def serve(
     try:
         # Check if FastAPI is available
         import uvicorn
-        from api import app as api_app
+        from api.main import app as api_app
         
-        # Start the server
+        # uvicorn's default "auto" loop/http picks uvloop and httptools when installed
         uvicorn.run(
-            "api:app",
+            "api.main:app",
             host=host,
             port=port,
             reload=reload
@@ -173,870 +309,361 @@ def serve(
         raise typer.Exit(1)
 
 
-@app.command()
-def status():
-    """Show status of data files and API server."""
-    
-    console.print("[bold]Synthetic Healthcare Data Status[/bold]\n")
-    
-    # Check data files
-    check_data_files()
-    
-    # Check if API server is running
-    check_api_server()
+# Commands the daemon will run on behalf of clients
+DAEMON_COMMANDS = {"generate", "validate", "status"}
 
 
 @app.command()
-def setup_wizard():
-    """🧙 Interactive setup wizard for beginners - guides you through the entire process!"""
-    
-    console.print(Panel.fit(
-        "[bold blue]🏥 Welcome to the Healthcare Data System Setup Wizard![/bold blue]\n\n"
-        "This wizard will guide you through setting up your synthetic healthcare database\n"
-        "step-by-step. Perfect for beginners! ✨\n\n"
-        "[dim]We'll help you choose the best setup method, configure everything automatically,\n"
-        "and get you up and running with sample data and APIs.[/dim]",
-        title="🧙 Setup Wizard",
-        border_style="blue"
-    ))
-    
-    # Step 1: Environment Detection and Recommendations
-    env_info = detect_environment()
-    show_environment_info(env_info)
-    
-    # Step 2: Choose Setup Method
-    setup_method = choose_setup_method(env_info)
-    
-    # Step 3: Configure Based on Method
-    config = configure_setup(setup_method, env_info)
-    
-    # Step 4: Run Setup Process
-    success = run_setup_process(setup_method, config)
-    
-    # Step 5: Verification and Next Steps
-    if success:
-        show_success_message(setup_method, config)
-    else:
-        show_failure_message()
-
-
-@app.command()
-def setup_wizard(
-    auto: bool = typer.Option(False, "--auto", help="Run in non-interactive mode with defaults"),
-    method: Optional[str] = typer.Option(None, "--method", help="Setup method: docker, native, api, gcp"),
-    patients: int = typer.Option(1000, "--patients", help="Number of patients to generate"),
+def daemon(
+    socket_path: str = typer.Option("/tmp/synthhc.sock", "--socket", help="Unix socket to listen on"),
 ):
-    """🧙 Interactive setup wizard for beginners - guides you through the entire process!"""
+    """Keep the CLI loaded and run generate/validate/status requests sent over a Unix socket.
     
-    if auto:
-        run_auto_setup(method, patients)
-        return
-        
-    console.print(Panel.fit(
-        "[bold blue]🏥 Welcome to the Healthcare Data System Setup Wizard![/bold blue]\n\n"
-        "This wizard will guide you through setting up your synthetic healthcare database\n"
-        "step-by-step. Perfect for beginners! ✨\n\n"
-        "[dim]We'll help you choose the best setup method, configure everything automatically,\n"
-        "and get you up and running with sample data and APIs.[/dim]",
-        title="🧙 Setup Wizard",
-        border_style="blue"
-    ))
-    
-    # Step 1: Environment Detection and Recommendations
-    env_info = detect_environment()
-    show_environment_info(env_info)
-    
-    # Step 2: Choose Setup Method
-    setup_method = choose_setup_method(env_info)
-    
-    # Step 3: Configure Based on Method
-    config = configure_setup(setup_method, env_info)
-    
-    # Step 4: Run Setup Process
-    success = run_setup_process(setup_method, config)
-    
-    # Step 5: Verification and Next Steps
-    if success:
-        show_success_message(setup_method, config)
-    else:
-        show_failure_message()
-
-
-def run_auto_setup(method: Optional[str], patients: int):
-    """Run automated setup with minimal user interaction."""
+    Each connection sends one JSON line such as
+    {"cmd": "generate", "args": ["--patients", "100"]} and receives
+    {"exit_code": 0, "output": "..."} back. {"cmd": "shutdown"} stops the daemon.
+    See cli-fast.sh for a client.
+    """
+    import socket
     
-    console.print(Panel(
-        "[bold green]🚀 Automated Setup Mode[/bold green]\n\n"
-        "Running quick setup with default settings...\n"
-        f"• Method: {method or 'api-only'}\n"
-        f"• Patients: {patients}",
-        border_style="green"
-    ))
-    
-    env_info = detect_environment()
-    
-    # Choose method automatically based on environment or user preference
-    if not method:
-        if env_info['in_codespace']:
-            setup_method = 'codespace'
-        elif env_info['has_docker'] and env_info.get('has_docker_compose'):
-            setup_method = 'docker'
-        else:
-            setup_method = 'api_only'
-    else:
-        # Map method names
-        method_mapping = {
-            'api': 'api_only',
-            'docker': 'docker',
-            'native': 'native',
-            'gcp': 'gcp',
-            'codespace': 'codespace'
-        }
-        setup_method = method_mapping.get(method, 'api_only')
-    
-    # Configure with defaults
-    config = {
-        'method': setup_method,
-        'patients': patients,
-        'include_ed': True,
-        'include_ip': True,
-        'seed': 42
-    }
-    
-    console.print(f"\n[cyan]Selected method: {setup_method}[/cyan]")
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]Error: Unix sockets are not supported on this platform[/red]")
+        raise typer.Exit(1)
     
-    # Run setup
-    success = run_setup_process(setup_method, config)
+    socket_file = Path(socket_path)
+    if socket_file.exists():
+        socket_file.unlink()
     
-    if success:
-        console.print("\n[bold green]✅ Automated setup completed successfully![/bold green]")
-        show_success_message(setup_method, config)
-    else:
-        console.print("\n[bold red]❌ Automated setup failed.[/bold red]")
-        console.print("Try running the interactive wizard: [cyan]python cli.py setup-wizard[/cyan]")
-
-
-def detect_environment() -> Dict:
-    """Detect the current environment and available tools."""
-    env_info = {
-        'os': platform.system(),
-        'python_version': sys.version,
-        'has_docker': shutil.which('docker') is not None,
-        'has_mysql': False,
-        'has_git': shutil.which('git') is not None,
-        'in_codespace': os.environ.get('CODESPACES') == 'true',
-        'has_make': shutil.which('make') is not None,
-        'working_directory': os.getcwd()
-    }
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    console.print(f"[bold cyan]CLI daemon listening on {socket_path}[/bold cyan]")
     
-    # Check MySQL
     try:
-        result = subprocess.run(['mysql', '--version'], 
-                              capture_output=True, text=True, timeout=5)
-        env_info['has_mysql'] = result.returncode == 0
-        if result.returncode == 0:
-            env_info['mysql_version'] = result.stdout.strip()
-    except:
-        env_info['has_mysql'] = False
-    
-    # Check Docker Compose
-    if env_info['has_docker']:
-        try:
-            result = subprocess.run(['docker', 'compose', 'version'], 
-                                  capture_output=True, text=True, timeout=5)
-            env_info['has_docker_compose'] = result.returncode == 0
-        except:
-            env_info['has_docker_compose'] = False
-    else:
-        env_info['has_docker_compose'] = False
-    
-    return env_info
-
-
-def show_environment_info(env_info: Dict):
-    """Display environment detection results."""
-    
-    console.print("\n[bold cyan]🔍 Environment Detection Results[/bold cyan]")
-    
-    # Create a table for environment info
-    table = Table(show_header=False, box=None, pad_edge=False)
-    table.add_column("Feature", style="cyan")
-    table.add_column("Status", justify="center")
-    table.add_column("Details", style="dim")
-    
-    # Operating System
-    table.add_row("Operating System", "ℹ️", env_info['os'])
-    
-    # Python
-    python_version = env_info['python_version'].split()[0]
-    table.add_row("Python Version", "✅", python_version)
-    
-    # Tools availability
-    table.add_row("Docker", "✅" if env_info['has_docker'] else "❌", 
-                  "Available" if env_info['has_docker'] else "Not found")
-    
-    table.add_row("Docker Compose", "✅" if env_info.get('has_docker_compose') else "❌", 
-                  "Available" if env_info.get('has_docker_compose') else "Not available")
-    
-    table.add_row("MySQL Client", "✅" if env_info['has_mysql'] else "❌", 
-                  env_info.get('mysql_version', 'Not found'))
-    
-    table.add_row("GitHub Codespace", "✅" if env_info['in_codespace'] else "❌", 
-                  "Yes" if env_info['in_codespace'] else "No")
-    
-    console.print(table)
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rwb") as stream:
+                try:
+                    request = json.loads(stream.readline() or b"{}")
+                    cmd = request.get("cmd")
+                    args = [str(arg) for arg in request.get("args", [])]
+                except (ValueError, AttributeError, TypeError):
+                    cmd, args = None, []
+                
+                if cmd == "shutdown":
+                    stream.write(b'{"exit_code": 0, "output": "shutting down"}\n')
+                    break
+                reply = run_daemon_command(cmd, args)
+                stream.write(json.dumps(reply).encode() + b"\n")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if socket_file.exists():
+            socket_file.unlink()
+    console.print("[yellow]CLI daemon stopped[/yellow]")
 
 
-def choose_setup_method(env_info: Dict) -> str:
-    """Let user choose the setup method based on their environment."""
-    
-    console.print(f"\n[bold green]📋 Recommended Setup Methods[/bold green]")
+def run_daemon_command(cmd: Optional[str], args: List[str]) -> Dict:
+    """Run one CLI command in this process and return its exit code and console output."""
+    if cmd not in DAEMON_COMMANDS:
+        return {"exit_code": 2, "output": f"Unsupported command: {cmd!r}. Supported: {', '.join(sorted(DAEMON_COMMANDS))}\n"}
     
-    # Build recommendations based on environment
-    methods = []
-    
-    if env_info['in_codespace']:
-        methods.append({
-            'key': 'codespace',
-            'name': '🚀 GitHub Codespace (Recommended for you!)',
-            'description': 'Perfect for your current environment - everything is pre-configured',
-            'difficulty': 'Easy',
-            'time': '2-3 minutes',
-            'recommended': True
-        })
-    
-    if env_info['has_docker'] and env_info.get('has_docker_compose'):
-        methods.append({
-            'key': 'docker',
-            'name': '🐳 Docker Compose (Great for local development)',
-            'description': 'Isolated environment with MySQL and API services',
-            'difficulty': 'Easy',
-            'time': '5-7 minutes',
-            'recommended': not env_info['in_codespace']
-        })
-    
-    methods.append({
-        'key': 'native',
-        'name': '⚡ Native Setup (Fastest if you have MySQL)',
-        'description': 'Use your local MySQL installation',
-        'difficulty': 'Medium' if not env_info['has_mysql'] else 'Easy',
-        'time': '3-5 minutes' if env_info['has_mysql'] else '10-15 minutes',
-        'recommended': False
-    })
-    
-    methods.append({
-        'key': 'api_only',
-        'name': '📊 API Only (No database required)',
-        'description': 'Just generate data files and start the API server',
-        'difficulty': 'Easy',
-        'time': '1-2 minutes',
-        'recommended': False
-    })
-    
-    methods.append({
-        'key': 'gcp',
-        'name': '☁️ Google Cloud Platform (Advanced)',
-        'description': 'Deploy to GCP with managed MySQL',
-        'difficulty': 'Advanced',
-        'time': '20-30 minutes',
-        'recommended': False
-    })
-    
-    # Display options
-    for i, method in enumerate(methods, 1):
-        style = "bold green" if method['recommended'] else "white"
-        rec_text = " ⭐ RECOMMENDED" if method['recommended'] else ""
-        
-        panel_content = (f"[{style}]{method['name']}{rec_text}[/{style}]\n\n"
-                        f"{method['description']}\n\n"
-                        f"[dim]Difficulty: {method['difficulty']} | "
-                        f"Estimated time: {method['time']}[/dim]")
-        
-        console.print(Panel(panel_content, 
-                          title=f"Option {i}",
-                          border_style="green" if method['recommended'] else "white"))
-    
-    # Get user choice
-    while True:
-        choice = Prompt.ask(
-            "\n[bold yellow]Which setup method would you like to use?[/bold yellow]",
-            choices=[str(i) for i in range(1, len(methods) + 1)],
-            default="1" if methods[0]['recommended'] else None
-        )
-        
+    with console.capture() as capture:
         try:
-            selected_method = methods[int(choice) - 1]
-            console.print(f"\n[green]✅ You selected: {selected_method['name']}[/green]")
-            
-            if Confirm.ask("Is this correct?", default=True):
-                return selected_method['key']
-        except (ValueError, IndexError):
-            console.print("[red]Invalid choice. Please try again.[/red]")
-
-
-def configure_setup(setup_method: str, env_info: Dict) -> Dict:
-    """Configure the setup based on the chosen method."""
-    
-    console.print(f"\n[bold blue]⚙️ Configuration Setup[/bold blue]")
-    
-    config = {
-        'method': setup_method,
-        'patients': 1000,
-        'seed': 42,
-        'include_ed': True,
-        'include_ip': True,
-        'api_port': 8000
-    }
-    
-    if setup_method == 'codespace':
-        return configure_codespace(config)
-    elif setup_method == 'docker':
-        return configure_docker(config)
-    elif setup_method == 'native':
-        return configure_native(config, env_info)
-    elif setup_method == 'api_only':
-        return configure_api_only(config)
-    elif setup_method == 'gcp':
-        return configure_gcp(config)
-    
-    return config
-
-
-def configure_codespace(config: Dict) -> Dict:
-    """Configure for GitHub Codespace environment."""
-    console.print(Panel(
-        "[green]🚀 GitHub Codespace Configuration[/green]\n\n"
-        "Great news! Since you're in a Codespace, most configuration is automatic.\n"
-        "The devcontainer has already set up MySQL and all dependencies.\n\n"
-        "Let's configure your data generation preferences:",
-        border_style="green"
-    ))
-    
-    config.update(get_data_preferences())
-    return config
-
-
-def configure_docker(config: Dict) -> Dict:
-    """Configure for Docker Compose setup."""
-    console.print(Panel(
-        "[blue]🐳 Docker Compose Configuration[/blue]\n\n"
-        "Docker Compose will create isolated containers for:\n"
-        "• MySQL database server\n"
-        "• Python application with all dependencies\n\n"
-        "Let's configure your preferences:",
-        border_style="blue"
-    ))
-    
-    config.update(get_data_preferences())
-    
-    # Check if .env exists, offer to create it
-    if not Path('.env').exists():
-        if Confirm.ask("Create .env configuration file?", default=True):
-            create_env_file('docker')
-            console.print("[green]✅ Created .env file with Docker defaults[/green]")
-    
-    return config
-
-
-def configure_native(config: Dict, env_info: Dict) -> Dict:
-    """Configure for native MySQL setup."""
-    console.print(Panel(
-        "[yellow]⚡ Native MySQL Configuration[/yellow]\n\n"
-        "You'll use your local MySQL installation.\n"
-        "We'll help you configure the database connection.",
-        border_style="yellow"
-    ))
-    
-    config.update(get_data_preferences())
-    config.update(get_mysql_config(env_info))
-    
-    return config
+            exit_code = app([cmd, *args], prog_name="cli.py", standalone_mode=False)
+        except Exception as e:
+            console.print(f"[red]{type(e).__name__}: {e}[/red]")
+            exit_code = 1
+    return {"exit_code": exit_code or 0, "output": capture.get()}
 
 
-def configure_api_only(config: Dict) -> Dict:
-    """Configure for API-only setup (no database)."""
-    console.print(Panel(
-        "[cyan]📊 API-Only Configuration[/cyan]\n\n"
-        "This mode generates data files (CSV) and starts the API server.\n"
-        "No database setup required - perfect for quick exploration!",
-        border_style="cyan"
-    ))
-    
-    config.update(get_data_preferences())
-    return config
-
-
-def configure_gcp(config: Dict) -> Dict:
-    """Configure for Google Cloud Platform deployment."""
-    console.print(Panel(
-        "[red]☁️ Google Cloud Platform Configuration[/red]\n\n"
-        "⚠️  This is an advanced setup method that requires:\n"
-        "• GCP account with billing enabled\n"
-        "• gcloud CLI installed and configured\n"
-        "• Understanding of cloud costs\n\n"
-        "[bold]This will create real cloud resources that may incur charges![/bold]",
-        border_style="red"
-    ))
+@app.command()
+def status():
+    """Show status of data files and API server."""
     
-    if not Confirm.ask("Do you want to continue with GCP setup?", default=False):
-        console.print("[yellow]Switching to Docker setup instead...[/yellow]")
-        return configure_docker(config)
+    console.print("[bold]Synthetic Healthcare Data Status[/bold]\n")
     
-    config.update(get_data_preferences())
-    config.update(get_gcp_config())
+    # Check data files
+    check_data_files()
     
-    return config
+    # Check if API server is running
+    check_api_server()
 
 
-def get_data_preferences() -> Dict:
-    """Get user preferences for data generation."""
-    console.print("\n[bold]📊 Data Generation Preferences[/bold]")
-    
-    # Number of patients
-    patients = IntPrompt.ask(
-        "How many synthetic patients would you like to generate?",
-        default=1000,
-        show_default=True
-    )
-    
-    if patients > 10000:
-        console.print("[yellow]⚠️  Large datasets (>10k patients) may take several minutes to generate.[/yellow]")
-        if not Confirm.ask("Continue with this size?", default=True):
-            patients = IntPrompt.ask("Enter a smaller number", default=1000)
-    
-    # Data types
-    include_ed = Confirm.ask("Include Emergency Department encounters?", default=True)
-    include_ip = Confirm.ask("Include Inpatient stays?", default=True)
+@app.command()
+def setup_wizard(
+    auto: bool = typer.Option(False, "--auto", help="Run in non-interactive mode with defaults"),
+    method: Optional[str] = typer.Option(None, "--method", help="Setup method: docker, native, api, gcp"),
+    patients: int = typer.Option(1000, "--patients", help="Number of patients to generate"),
+):
+    """🧙 Interactive setup wizard for beginners - guides you through the entire process!"""
+    # Imported here so the other commands never load the wizard code
+    from cli_wizard import run_wizard
     
-    return {
-        'patients': patients,
-        'include_ed': include_ed,
-        'include_ip': include_ip
-    }
+    run_wizard(auto, method, patients)
 
 
-def get_mysql_config(env_info: Dict) -> Dict:
-    """Get MySQL configuration from user."""
-    console.print("\n[bold]🔧 MySQL Database Configuration[/bold]")
+@app.command()
+def clean(
+    data_dir: str = typer.Option("./data", "--data-dir", "-d", help="Data directory to clean"),
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+):
+    """Clean generated data files."""
     
-    if not env_info['has_mysql']:
-        console.print(Panel(
-            "[red]⚠️  MySQL client not found![/red]\n\n"
-            "You'll need to install MySQL first. Here's how:\n\n"
-            "[bold]Ubuntu/Debian:[/bold] sudo apt install mysql-server mysql-client\n"
-            "[bold]macOS:[/bold] brew install mysql\n"
-            "[bold]Windows:[/bold] Download from https://dev.mysql.com/downloads/mysql/\n\n"
-            "Or consider using Docker Compose instead (easier!)",
-            border_style="red"
-        ))
+    if not confirm:
+        confirm = typer.confirm(f"Are you sure you want to delete all files in {data_dir}?")
         
-        if Confirm.ask("Switch to Docker Compose setup?", default=True):
-            return {'switch_to_docker': True}
-    
-    host = Prompt.ask("MySQL Host", default="localhost")
-    port = IntPrompt.ask("MySQL Port", default=3306)
-    user = Prompt.ask("MySQL User", default="root")
-    password = Prompt.ask("MySQL Password", password=True, default="")
-    database = Prompt.ask("Database Name", default="lm_synth")
-    
-    return {
-        'mysql_host': host,
-        'mysql_port': port,
-        'mysql_user': user,
-        'mysql_password': password,
-        'mysql_database': database
-    }
-
-
-def get_gcp_config() -> Dict:
-    """Get GCP configuration from user."""
-    console.print("\n[bold]☁️ Google Cloud Platform Configuration[/bold]")
-    
-    # Show GCP setup instructions
-    console.print(Panel(
-        "[bold blue]GCP Setup Instructions:[/bold blue]\n\n"
-        "1. Create a GCP project: https://console.cloud.google.com/projectcreate\n"
-        "2. Enable Cloud SQL Admin API: https://console.cloud.google.com/apis/library/sqladmin.googleapis.com\n"
-        "3. Create a service account with Cloud SQL Admin role\n"
-        "4. Download the service account JSON key file\n"
-        "5. Install gcloud CLI: https://cloud.google.com/sdk/docs/install\n\n"
-        "[yellow]💰 Cost estimate: ~$20-50/month for a small instance[/yellow]",
-        title="📋 Prerequisites",
-        border_style="blue"
-    ))
-    
-    project_id = Prompt.ask("GCP Project ID")
-    region = Prompt.ask("GCP Region", default="us-central1")
-    instance_name = Prompt.ask("Cloud SQL Instance Name", default="healthcare-db")
-    
-    # Service account key
-    key_file = Prompt.ask("Path to service account JSON key file")
-    if not Path(key_file).exists():
-        console.print("[red]❌ Key file not found. Please check the path.[/red]")
-        return get_gcp_config()  # Retry
-    
-    return {
-        'gcp_project': project_id,
-        'gcp_region': region,
-        'gcp_instance': instance_name,
-        'gcp_key_file': key_file
-    }
-
-
-def create_env_file(setup_type: str):
-    """Create .env file based on setup type."""
-    if setup_type == 'docker':
-        env_content = """# Docker Compose Configuration
-MYSQL_HOST=mysql
-MYSQL_PORT=3306
-MYSQL_USER=root
-MYSQL_PASSWORD=healthcare123
-MYSQL_DATABASE=lm_synth
-MYSQL_ROOT_PASSWORD=healthcare123
-
-# API Configuration
-API_HOST=0.0.0.0
-API_PORT=8000
-"""
-    else:
-        env_content = """# Native MySQL Configuration
-MYSQL_HOST=localhost
-MYSQL_PORT=3306
-MYSQL_USER=root
-MYSQL_PASSWORD=
-MYSQL_DATABASE=lm_synth
-
-# API Configuration  
-API_HOST=localhost
-API_PORT=8000
-"""
-    
-    with open('.env', 'w') as f:
-        f.write(env_content)
-
-
-def run_setup_process(setup_method: str, config: Dict) -> bool:
-    """Execute the setup process based on method and configuration."""
-    
-    console.print(f"\n[bold green]🚀 Starting Setup Process[/bold green]")
+    if not confirm:
+        console.print("Operation cancelled.")
+        return
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        data_path = Path(data_dir)
+        if data_path.exists():
+            remove_tree(data_path)
+            console.print(f"[green]✓ Cleaned data directory: {data_dir}[/green]")
+        else:
+            console.print(f"[yellow]Data directory {data_dir} does not exist[/yellow]")
             
-            if setup_method == 'codespace':
-                return run_codespace_setup(config, progress)
-            elif setup_method == 'docker':
-                return run_docker_setup(config, progress)
-            elif setup_method == 'native':
-                return run_native_setup(config, progress)
-            elif setup_method == 'api_only':
-                return run_api_only_setup(config, progress)
-            elif setup_method == 'gcp':
-                return run_gcp_setup(config, progress)
-                
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Setup interrupted by user.[/yellow]")
-        return False
     except Exception as e:
-        console.print(f"\n[red]❌ Setup failed: {str(e)}[/red]")
-        return False
-    
-    return False
-
+        console.print(f"[red]Error cleaning data directory: {str(e)}[/red]")
+        raise typer.Exit(1)
 
-def run_codespace_setup(config: Dict, progress) -> bool:
-    """Run setup for GitHub Codespace."""
-    
-    task1 = progress.add_task("Installing dependencies...", total=None)
-    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
-        return False
-    progress.update(task1, completed=100)
-    
-    task2 = progress.add_task("Generating sample data...", total=None)
-    cmd = build_generate_command(config)
-    if not run_command_with_progress(cmd, progress, task2):
-        return False
-    progress.update(task2, completed=100)
-    
-    task3 = progress.add_task("Setting up database...", total=None)
-    if not run_command_with_progress("python load_data.py", progress, task3):
-        return False
-    progress.update(task3, completed=100)
-    
-    return True
 
+def remove_tree(path: Path):
+    """Delete a directory tree, using coreutils rm where available.
 
-def run_docker_setup(config: Dict, progress) -> bool:
-    """Run setup for Docker Compose."""
-    
-    task1 = progress.add_task("Starting Docker containers...", total=None)
-    if not run_command_with_progress("docker compose up -d", progress, task1):
-        return False
-    progress.update(task1, completed=100)
-    
-    # Wait for MySQL to be ready
-    task2 = progress.add_task("Waiting for MySQL to be ready...", total=None)
-    if not wait_for_mysql_docker(progress, task2):
-        return False
-    progress.update(task2, completed=100)
-    
-    task3 = progress.add_task("Installing dependencies in container...", total=None)
-    if not run_command_with_progress("docker compose exec -T app pip install -r requirements.txt", progress, task3):
-        return False
-    progress.update(task3, completed=100)
-    
-    task4 = progress.add_task("Generating sample data...", total=None)
-    cmd = f"docker compose exec -T app {build_generate_command(config)}"
-    if not run_command_with_progress(cmd, progress, task4):
-        return False
-    progress.update(task4, completed=100)
-    
-    task5 = progress.add_task("Loading data into database...", total=None)
-    if not run_command_with_progress("docker compose exec -T app python load_data.py", progress, task5):
-        return False
-    progress.update(task5, completed=100)
-    
-    return True
+    rm -rf avoids Python's per-entry overhead, which matters for trees with
+    very many small files. Elsewhere (Windows, no rm) it falls back to
+    shutil.rmtree.
+    """
+    rm = shutil.which("rm") if sys.platform != "win32" else None
+    if rm:
+        subprocess.run([rm, "-rf", "--", str(path)], check=True)
+    else:
+        shutil.rmtree(path)
 
 
-def run_native_setup(config: Dict, progress) -> bool:
-    """Run setup for native MySQL."""
-    
-    if config.get('switch_to_docker'):
-        console.print("[yellow]Switching to Docker setup...[/yellow]")
-        return run_docker_setup(config, progress)
-    
-    task1 = progress.add_task("Installing dependencies...", total=None)
-    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
-        return False
-    progress.update(task1, completed=100)
-    
-    task2 = progress.add_task("Creating database schema...", total=None)
-    create_cmd = f"mysql -h {config['mysql_host']} -P {config['mysql_port']} -u {config['mysql_user']}"
-    if config['mysql_password']:
-        create_cmd += f" -p{config['mysql_password']}"
-    create_cmd += f" -e \"CREATE DATABASE IF NOT EXISTS {config['mysql_database']} CHARACTER SET utf8mb4 COLLATE utf8mb4_0900_ai_ci;\""
-    
-    if not run_command_with_progress(create_cmd, progress, task2):
-        return False
-    
-    # Load schema
-    schema_cmd = f"mysql -h {config['mysql_host']} -P {config['mysql_port']} -u {config['mysql_user']}"
-    if config['mysql_password']:
-        schema_cmd += f" -p{config['mysql_password']}"
-    schema_cmd += f" {config['mysql_database']} < schema.sql"
-    
-    if not run_command_with_progress(schema_cmd, progress, task2):
-        return False
-    progress.update(task2, completed=100)
-    
-    task3 = progress.add_task("Generating sample data...", total=None)
-    if not run_command_with_progress(build_generate_command(config), progress, task3):
-        return False
-    progress.update(task3, completed=100)
-    
-    task4 = progress.add_task("Loading data into database...", total=None)
-    load_cmd = f"python load_data.py --host {config['mysql_host']} --port {config['mysql_port']} --user {config['mysql_user']}"
-    if config['mysql_password']:
-        load_cmd += f" --password {config['mysql_password']}"
-    
-    if not run_command_with_progress(load_cmd, progress, task4):
-        return False
-    progress.update(task4, completed=100)
-    
-    return True
+def run_streaming(cmd: List[str], tail_lines: int = 20):
+    """Run cmd, echoing its stdout and stderr to the console line by line.
 
+    Unlike capture_output=True, nothing is buffered beyond the last
+    tail_lines of stderr, which become the CalledProcessError's stderr if
+    the command fails.
+    """
+    stderr_tail = deque(maxlen=tail_lines)
+    # Unbuffered so Python children (generate_data.py, validate.py) emit lines as they go
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1, env=env
+    )
 
-def run_api_only_setup(config: Dict, progress) -> bool:
-    """Run setup for API-only mode."""
+    def drain_stderr():
+        for line in proc.stderr:
+            stderr_tail.append(line)
+            console.print(line.rstrip("\n"), style="yellow", markup=False, highlight=False)
+
+    stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+    stderr_thread.start()
+    for line in proc.stdout:
+        console.print(line.rstrip("\n"), style="dim", markup=False, highlight=False)
+    stderr_thread.join()
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="".join(stderr_tail))
+
+
+def count_csv_rows(path: Path) -> int:
+    """Count data rows in a CSV file without parsing it.
+
+    Counts newlines, minus one for the header. A final line without a
+    trailing newline is still counted. Files containing quote characters may
+    have quoted fields that span lines, so they fall back to
+    count_csv_rows_parsed.
+    """
+    with open(path, "rb") as f:
+        counted = None
+        if os.fstat(f.fileno()).st_size >= MMAP_COUNT_THRESHOLD:
+            counted = count_newlines_mmap(f)
+        if counted is None:
+            counted = count_newlines_buffered(f)
+    newlines, quoted, last = counted
+    if quoted:
+        return count_csv_rows_parsed(path)
+    if last and last != b"\n":
+        newlines += 1
+    return max(newlines - 1, 0)
+
+
+def count_newlines_buffered(f) -> Tuple[int, bool, bytes]:
+    """Return (newline count, whether a quote was seen, last byte), reading 1 MB at a time."""
+    newlines = 0
+    quoted = False
+    last = b""
+    for chunk in iter(lambda: f.read(1 << 20), b""):
+        newlines += chunk.count(b"\n")
+        quoted = quoted or b'"' in chunk
+        last = chunk[-1:]
+    return newlines, quoted, last
+
+
+def count_newlines_mmap(f) -> Optional[Tuple[int, bool, bytes]]:
+    """Like count_newlines_buffered, but over a memory map of the whole file.
+
+    The kernel pages the file in directly, so there is no copy into Python
+    bytes. Newlines are counted with NumPy over 8 MB windows on a small,
+    fixed thread pool (the comparisons release the GIL), so the boolean
+    temporaries stay at MMAP_COUNT_WORKERS windows whatever the core count.
+    Each window is checked for quotes in the same pass.
+    Returns None if the file cannot be memory-mapped (pipes, special files).
+    """
+    import mmap
+    import numpy as np
     
-    task1 = progress.add_task("Installing dependencies...", total=None)
-    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
-        return False
-    progress.update(task1, completed=100)
-    
-    task2 = progress.add_task("Generating sample data files...", total=None)
-    if not run_command_with_progress(build_generate_command(config), progress, task2):
-        return False
-    progress.update(task2, completed=100)
-    
-    return True
-
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    with mm:
+        data = np.frombuffer(mm, dtype=np.uint8)
+        window = 8 << 20
+        
+        def count_window(start: int) -> Tuple[int, bool]:
+            end = start + window
+            quoted = mm.find(b'"', start, end) != -1
+            return int(np.count_nonzero(data[start:end] == ord("\n"))), quoted
+        
+        with ThreadPoolExecutor(max_workers=MMAP_COUNT_WORKERS) as executor:
+            counts = list(executor.map(count_window, range(0, len(data), window)))
+        newlines = sum(n for n, _ in counts)
+        quoted = any(q for _, q in counts)
+        last = mm[-1:]
+        # Drop the array's reference to the map before it is closed
+        del data
+    return newlines, quoted, last
+
+
+def count_csv_rows_parsed(path: Path) -> int:
+    """Count CSV rows with the streaming Arrow parser, one block at a time.
+
+    Only the first column is converted (as strings), since just the count is needed.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    first_column = read_csv_header(path)[0]
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[first_column], column_types={first_column: pa.string()}
+        ),
+    )
+    return sum(batch.num_rows for batch in reader)
 
-def run_gcp_setup(config: Dict, progress) -> bool:
-    """Run setup for Google Cloud Platform."""
-    
-    # This is a simplified version - full GCP setup would be quite complex
-    console.print("[yellow]⚠️  GCP setup is complex and not fully implemented in this wizard.[/yellow]")
-    console.print("Please refer to the GCP documentation for manual setup.")
-    return False
 
+def read_csv_header(path: Path) -> List[str]:
+    """Return the column names from a CSV file's header line."""
+    with open(path, newline="") as f:
+        return next(csv.reader(f), [])
 
-def build_generate_command(config: Dict) -> str:
-    """Build the data generation command based on config."""
-    cmd = f"python generate_data.py --patients {config['patients']}"
-    
-    if not config.get('include_ed', True):
-        cmd += " --no-ed"
-    if not config.get('include_ip', True):
-        cmd += " --no-ip"
-    
-    return cmd
 
+def scan_data_dir(data_dir) -> Dict[str, os.DirEntry]:
+    """Map the names of files in data_dir to their DirEntry, from one directory read.
 
-def run_command_with_progress(command: str, progress, task_id) -> bool:
-    """Run a command and update progress."""
+    Returns an empty dict if the directory does not exist.
+    """
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        console.print(f"\n[red]⚠️ Command timed out: {command}[/red]")
-        return False
-    except Exception as e:
-        console.print(f"\n[red]⚠️ Command failed: {str(e)}[/red]")
-        return False
+        with os.scandir(data_dir) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
 
 
-def wait_for_mysql_docker(progress, task_id) -> bool:
-    """Wait for MySQL to be ready in Docker."""
-    import time
-    
-    for i in range(30):  # Wait up to 30 seconds
-        try:
-            result = subprocess.run(
-                "docker compose exec -T mysql mysqladmin ping -h localhost --silent",
-                shell=True, capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                return True
-        except:
-            pass
-        time.sleep(1)
-    
-    return False
+def stat_or_none(path: Path, entries: Optional[Dict[str, os.DirEntry]] = None) -> Optional[os.stat_result]:
+    """stat() path, or look it up in entries from scan_data_dir; None if missing."""
+    if entries is not None:
+        entry = entries.get(path.name)
+        return entry.stat() if entry else None
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def select_data_file(
+    csv_path: Path, entries: Optional[Dict[str, os.DirEntry]] = None
+) -> Tuple[Path, Optional[os.stat_result]]:
+    """Return the file to read for csv_path together with its stat result.
+
+    That is the Parquet copy when one exists and is at least as new as the
+    CSV (it is not if data was regenerated as CSV afterwards), otherwise
+    csv_path itself. The stat result is None when csv_path does not exist.
+    Each file is stat-ed once, so callers reuse the result for sizes and
+    mtimes instead of calling exists()/stat() again.
+    """
+    csv_stat = stat_or_none(csv_path, entries)
+    if csv_stat is None:
+        return csv_path, None
+    parquet_path = csv_path.with_suffix(".parquet")
+    parquet_stat = stat_or_none(parquet_path, entries)
+    if parquet_stat is not None and parquet_stat.st_mtime_ns >= csv_stat.st_mtime_ns:
+        return parquet_path, parquet_stat
+    return csv_path, csv_stat
+
+
+def count_data_rows(path: Path) -> int:
+    """Count rows in a data file, from Parquet footer metadata or CSV newlines."""
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    return count_csv_rows(path)
+
+
+def read_csv_arrow(path: Path, columns: Optional[List[str]] = None, strings_can_be_null: bool = False):
+    """Fully parse a CSV file into a pyarrow Table with the multithreaded Arrow reader.
+
+    Columns listed in CSV_DTYPES get those types; other columns use Arrow's
+    type inference. columns, if given, limits which columns are parsed. With
+    strings_can_be_null, empty and "NA"-style strings read as nulls, as
+    pandas would read them.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    arrow_types = {"int64": pa.int64(), "float64": pa.float64(), "str": pa.string()}
+    dtypes = CSV_DTYPES.get(path.name)
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: arrow_types[dtype] for col, dtype in dtypes.items()} if dtypes else None,
+        include_columns=columns,
+        strings_can_be_null=strings_can_be_null,
+    )
+    return pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+        convert_options=convert_options,
+    )
 
 
-def show_success_message(setup_method: str, config: Dict):
-    """Show success message and next steps."""
-    
-    console.print(Panel(
-        "[bold green]🎉 Setup Complete! 🎉[/bold green]\n\n"
-        "Your synthetic healthcare database is ready to use!\n\n"
-        f"[dim]Setup method: {setup_method}[/dim]\n"
-        f"[dim]Generated {config['patients']} synthetic patients[/dim]",
-        title="✅ Success",
-        border_style="green"
-    ))
-    
-    # Show next steps based on setup method
-    next_steps = get_next_steps(setup_method, config)
+def convert_csv_to_parquet(data_dir: str):
+    """Write a Parquet copy next to every CSV file in data_dir."""
+    import pyarrow.parquet as pq
     
-    console.print(f"\n[bold cyan]🚀 What's Next?[/bold cyan]")
-    for step in next_steps:
-        console.print(f"• {step}")
-    
-    # Show useful commands
-    console.print(f"\n[bold yellow]🔧 Useful Commands:[/bold yellow]")
-    console.print("• [cyan]python cli.py status[/cyan] - Check system status")
-    console.print("• [cyan]python cli.py validate[/cyan] - Validate generated data")
-    console.print("• [cyan]python cli.py clean[/cyan] - Clean up generated files")
-    
-    if setup_method in ['codespace', 'native']:
-        console.print("• [cyan]python -m uvicorn main_api:app --reload[/cyan] - Start API server")
-    elif setup_method == 'docker':
-        console.print("• [cyan]docker compose logs[/cyan] - View container logs")
-        console.print("• [cyan]docker compose down[/cyan] - Stop all containers")
+    for csv_file in sorted(Path(data_dir).glob("*.csv")):
+        pq.write_table(read_csv_arrow(csv_file), csv_file.with_suffix(".parquet"))
 
 
-def get_next_steps(setup_method: str, config: Dict) -> List[str]:
-    """Get next steps based on setup method."""
-    
-    if setup_method == 'codespace':
-        return [
-            "Access the API documentation at the forwarded port URL",
-            "Try sample queries in the MySQL database",
-            "Explore the generated data files in the ./data/ directory",
-            "Use the CLI commands to manage your data"
-        ]
-    
-    elif setup_method == 'docker':
-        return [
-            "Visit http://localhost:8000/docs for API documentation",
-            "Connect to MySQL: docker compose exec mysql mysql -u root -p lm_synth",
-            "View container logs: docker compose logs",
-            "Explore data files: ls -la data/"
-        ]
-    
-    elif setup_method == 'native':
-        return [
-            f"Connect to MySQL: mysql -h {config['mysql_host']} -u {config['mysql_user']} -p {config['mysql_database']}",
-            "Start API server: python -m uvicorn main_api:app --reload",
-            "Visit http://localhost:8000/docs for API documentation",
-            "Explore data files: ls -la data/"
-        ]
-    
-    elif setup_method == 'api_only':
-        return [
-            "Start API server: python -m uvicorn main_api:app --reload",
-            "Visit http://localhost:8000/docs for API documentation", 
-            "Explore generated CSV files: ls -la data/",
-            "No database setup required - data is served from files"
-        ]
-    
-    return ["Check the documentation for more information"]
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
-def show_failure_message():
-    """Show failure message with troubleshooting tips."""
-    
-    console.print(Panel(
-        "[bold red]❌ Setup Failed[/bold red]\n\n"
-        "Don't worry! Here are some common solutions:\n\n"
-        "🔍 [bold]Troubleshooting Steps:[/bold]\n"
-        "1. Check your internet connection\n"
-        "2. Ensure you have sufficient disk space (>1GB)\n"
-        "3. Try running with elevated privileges if needed\n"
-        "4. Check for firewall or antivirus interference\n\n"
-        "📞 [bold]Need Help?[/bold]\n"
-        "• Check the README.md for detailed setup instructions\n"
-        "• Review the troubleshooting section\n"
-        "• Try a different setup method (e.g., Docker instead of native)\n"
-        "• Run [cyan]python cli.py status[/cyan] to diagnose issues",
-        title="🚨 Setup Failed",
-        border_style="red"
-    ))
-
-
-@app.command()
-def clean(
-    data_dir: str = typer.Option("./data", "--data-dir", "-d", help="Data directory to clean"),
-    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
-):
-    """Clean generated data files."""
-    
-    if not confirm:
-        confirm = typer.confirm(f"Are you sure you want to delete all files in {data_dir}?")
-        
-    if not confirm:
-        console.print("Operation cancelled.")
-        return
-    
-    try:
-        data_path = Path(data_dir)
-        if data_path.exists():
-            import shutil
-            shutil.rmtree(data_path)
-            console.print(f"[green]✓ Cleaned data directory: {data_dir}[/green]")
-        else:
-            console.print(f"[yellow]Data directory {data_dir} does not exist[/yellow]")
-            
-    except Exception as e:
-        console.print(f"[red]Error cleaning data directory: {str(e)}[/red]")
-        raise typer.Exit(1)
+def format_size(size: int) -> str:
+    """Format a byte count as e.g. '512 B', '1.5 KB' or '2.0 MB'."""
+    # Each unit is 2**10 times the previous one, so bit_length picks the unit
+    exponent = min(max(size.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    if exponent == 0:
+        return f"{size} B"
+    return f"{size / (1 << (10 * exponent)):.1f} {SIZE_UNITS[exponent]}"
 
 
 def show_data_summary(data_dir: str):
@@ -1050,95 +677,276 @@ def show_data_summary(data_dir: str):
     data_path = Path(data_dir)
     total_records = 0
     
-    for csv_file in sorted(data_path.glob("*.csv")):
+    entries = scan_data_dir(data_path)
+    for name in sorted(name for name in entries if name.endswith(".csv")):
+        data_file, st = select_data_file(data_path / name, entries)
         try:
-            df = pd.read_csv(csv_file)
-            record_count = len(df)
-            file_size = csv_file.stat().st_size
-            
-            # Format file size
-            if file_size < 1024:
-                size_str = f"{file_size} B"
-            elif file_size < 1024 * 1024:
-                size_str = f"{file_size / 1024:.1f} KB"
-            else:
-                size_str = f"{file_size / (1024 * 1024):.1f} MB"
-            
-            table.add_row(csv_file.name, f"{record_count:,}", size_str)
+            record_count = count_data_rows(data_file)
+            table.add_row(data_file.name, f"{record_count:,}", format_size(st.st_size))
             total_records += record_count
             
         except Exception as e:
-            table.add_row(csv_file.name, "Error", str(e))
+            table.add_row(data_file.name, "Error", str(e))
+    
+    console.print(Group(table, console.render_str(f"\n[bold]Total records: {total_records:,}[/bold]")))
+
+
+def count_true(mask) -> int:
+    """Count True values in a boolean Arrow array; nulls count as False."""
+    import pyarrow.compute as pc
+    return pc.sum(mask).as_py() or 0
+
+
+def check_not_null(column: str) -> Callable:
+    def check(table) -> Optional[str]:
+        missing = table[column].null_count
+        return f"{column}: {missing:,} missing values" if missing else None
+    return check
+
+
+def check_unique(column: str) -> Callable:
+    def check(table) -> Optional[str]:
+        import pyarrow.compute as pc
+        # mode="all" counts null as one distinct value, so repeated nulls are duplicates
+        duplicates = len(table) - pc.count_distinct(table[column], mode="all").as_py()
+        return f"{column}: {duplicates:,} duplicate values" if duplicates else None
+    return check
+
+
+def check_isin(column: str, allowed) -> Callable:
+    def check(table) -> Optional[str]:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        value_set = pa.array(sorted(allowed), type=table[column].type)
+        invalid = len(table) - count_true(pc.is_in(table[column], value_set=value_set))
+        return f"{column}: {invalid:,} values outside {sorted(allowed)}" if invalid else None
+    return check
+
+
+def check_between(column: str, low: float, high: float) -> Callable:
+    def check(table) -> Optional[str]:
+        import pyarrow.compute as pc
+        in_range = pc.and_(pc.greater_equal(table[column], low), pc.less_equal(table[column], high))
+        invalid = len(table) - count_true(in_range)
+        return f"{column}: {invalid:,} values outside [{low}, {high}]" if invalid else None
+    return check
+
+
+# Vectorized data-quality checks per file, as (column, check) pairs. Each check
+# runs once over the whole Arrow column and returns an error message or None. Values
+# match what generate_data.py writes.
+AGE_GROUPS = {"0-4", "5-14", "15-24", "25-44", "45-64", "65-74", "75-84", "85+"}
+GENDERS = {"Female", "Male", "Other"}
+ED_SUBSERVICES = {"Adult ED", "Pediatric ED", "Urgent Care Centre"}
+DISPOSITIONS = {"Admit", "Discharge", "Transfer", "AMA", "Death"}
+
+VALIDATORS: Dict[str, List[Tuple[str, Callable]]] = {
+    "patients.csv": [
+        ("patient_id", check_not_null("patient_id")),
+        ("patient_id", check_unique("patient_id")),
+        ("age_group", check_isin("age_group", AGE_GROUPS)),
+        ("gender", check_isin("gender", GENDERS)),
+    ],
+    "ed_encounters.csv": [
+        ("patient_id", check_not_null("patient_id")),
+        ("ed_subservice", check_isin("ed_subservice", ED_SUBSERVICES)),
+        ("acuity", check_between("acuity", 1, 5)),
+        ("dispo", check_isin("dispo", DISPOSITIONS)),
+    ],
+    "ip_stays.csv": [
+        ("patient_id", check_not_null("patient_id")),
+        ("los_days", check_between("los_days", 0, 365)),
+        ("alc_flag", check_isin("alc_flag", {0, 1})),
+    ],
+}
+
+
+def run_validators(data_file: Path, filename: str, columns) -> List[str]:
+    """Run the VALIDATORS for filename, reading only the columns they need."""
+    checks = [(column, check) for column, check in VALIDATORS.get(filename, []) if column in columns]
+    if not checks:
+        return []
+    needed = sorted({column for column, _ in checks})
+    if data_file.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(data_file, columns=needed)
+    else:
+        table = read_csv_arrow(data_file, columns=needed, strings_can_be_null=True)
+    return [message for _, check in checks if (message := check(table))]
+
+
+def validate_data_file(data_file: Optional[Path], filename: str) -> dict:
+    """Run the basic checks on one data file, as chosen by select_data_file.
+    
+    data_file is None when the required CSV does not exist.
+    """
+    file_result = {"exists": False, "records": 0, "errors": [], "warnings": []}
     
-    console.print(table)
-    console.print(f"\n[bold]Total records: {total_records:,}[/bold]")
+    if data_file is None:
+        file_result["errors"].append("File does not exist")
+        return file_result
+    
+    file_result["exists"] = True
+    try:
+        if data_file.suffix == ".parquet":
+            # Row count and column names come from the Parquet footer
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(data_file)
+            n_rows = parquet_file.metadata.num_rows
+            columns = parquet_file.schema_arrow.names
+        else:
+            # Only the header is parsed; rows are counted by newlines
+            columns = read_csv_header(data_file)
+            n_rows = count_csv_rows(data_file)
+        file_result["records"] = n_rows
+        
+        # Basic checks
+        if n_rows == 0:
+            file_result["errors"].append("File is empty")
+        
+        # Check for required columns (basic validation)
+        if "patients" in filename and "patient_id" not in columns:
+            file_result["errors"].append("Missing patient_id column")
+        
+        # Data-quality checks need the column values, so only run on non-empty files
+        if n_rows > 0:
+            file_result["errors"].extend(run_validators(data_file, filename, columns))
+        
+    except Exception as e:
+        file_result["errors"].append(f"Error reading file: {str(e)}")
+    
+    return file_result
+
+
+def load_validation_cache() -> Dict:
+    """Load cached per-file validation results, discarding other cache versions."""
+    try:
+        with open(VALIDATION_CACHE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != VALIDATION_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_validation_cache(entries: Dict):
+    """Write the validation cache atomically (temp file + os.replace)."""
+    try:
+        VALIDATION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = VALIDATION_CACHE.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": VALIDATION_CACHE_VERSION, "files": entries}, f)
+        os.replace(tmp_path, VALIDATION_CACHE)
+    except OSError:
+        # The cache is only an optimization; validation results are unaffected
+        pass
 
 
 def perform_basic_validation(data_dir: str) -> dict:
-    """Perform basic validation of data files."""
+    """Perform basic validation of data files.
     
-    required_files = [
-        "dim_site.csv", "dim_program.csv", "dim_subprogram.csv", "dim_lha.csv",
-        "population_projection.csv", "ed_baseline_rates.csv",
-        "patients.csv", "ed_encounters.csv", "ip_stays.csv"
-    ]
+    Results for files whose size and modification time are unchanged since
+    the last run are taken from VALIDATION_CACHE instead of being re-read.
+    """
+    required_files = REQUIRED_FILES
+    data_path = Path(data_dir)
+    cache = load_validation_cache()
+    file_results = {}
+    # filename -> (cache key, stamp) for files that must be re-validated
+    pending = {}
+    
+    # filename -> file to read (None if missing), from one directory scan
+    data_files = {}
+    entries = scan_data_dir(data_path)
+    
+    for filename in required_files:
+        data_file, st = select_data_file(data_path / filename, entries)
+        if st is None:
+            data_files[filename] = None
+            cache_key = stamp = None
+        else:
+            data_files[filename] = data_file
+            cache_key = os.path.abspath(data_file)
+            stamp = [st.st_mtime_ns, st.st_size]
+        
+        cached_entry = cache.get(cache_key) if cache_key else None
+        if cached_entry and cached_entry["stamp"] == stamp:
+            file_results[filename] = cached_entry["result"]
+        else:
+            pending[filename] = (cache_key, stamp)
     
+    if len(pending) < 3:
+        for filename in track(list(pending), description="Validating files..."):
+            file_results[filename] = validate_data_file(data_files[filename], filename)
+    else:
+        # Reading is mostly I/O and Arrow's parser, which releases the GIL, so threads overlap well
+        with Progress(console=console) as progress, ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(pending))
+        ) as executor:
+            task_id = progress.add_task("Validating files...", total=len(pending))
+            futures = {
+                executor.submit(validate_data_file, data_files[filename], filename): filename
+                for filename in pending
+            }
+            for future in as_completed(futures):
+                file_results[futures[future]] = future.result()
+                progress.advance(task_id)
+    
+    for filename, (cache_key, stamp) in pending.items():
+        if cache_key:
+            cache[cache_key] = {"stamp": stamp, "result": file_results[filename]}
+    
+    if any(cache_key for cache_key, _ in pending.values()):
+        save_validation_cache(cache)
+    
+    return summarize_validation(data_dir, file_results)
+
+
+def summarize_validation(data_dir: str, file_results: Dict[str, dict]) -> dict:
+    """Build the validation report from per-file results, in REQUIRED_FILES order."""
     results = {
-        "timestamp": pd.Timestamp.now().isoformat(),
+        "timestamp": datetime.now().isoformat(),
         "data_directory": data_dir,
         "files": {},
         "summary": {
-            "total_files": len(required_files),
+            "total_files": len(REQUIRED_FILES),
             "passed": 0,
             "failed": 0,
             "total_records": 0
         }
     }
     
-    data_path = Path(data_dir)
-    
-    for filename in track(required_files, description="Validating files..."):
-        file_path = data_path / filename
-        file_result = {"exists": False, "records": 0, "errors": [], "warnings": []}
-        
-        if file_path.exists():
-            file_result["exists"] = True
-            try:
-                df = pd.read_csv(file_path)
-                file_result["records"] = len(df)
-                
-                # Basic checks
-                if len(df) == 0:
-                    file_result["errors"].append("File is empty")
-                
-                # Check for required columns (basic validation)
-                if "patients" in filename and "patient_id" not in df.columns:
-                    file_result["errors"].append("Missing patient_id column")
-                
-                if len(file_result["errors"]) == 0:
-                    results["summary"]["passed"] += 1
-                else:
-                    results["summary"]["failed"] += 1
-                
-                results["summary"]["total_records"] += len(df)
-                
-            except Exception as e:
-                file_result["errors"].append(f"Error reading file: {str(e)}")
-                results["summary"]["failed"] += 1
+    # Whatever order files finished in, the report follows REQUIRED_FILES
+    for filename in REQUIRED_FILES:
+        file_result = file_results[filename]
+        if file_result["exists"] and not file_result["errors"]:
+            results["summary"]["passed"] += 1
         else:
-            file_result["errors"].append("File does not exist")
             results["summary"]["failed"] += 1
+        results["summary"]["total_records"] += file_result["records"]
         
         results["files"][filename] = file_result
     
     return results
 
 
+def write_json_report(path: Path, report: dict):
+    """Write a report as indented JSON, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return
+    path.write_bytes(orjson.dumps(
+        report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    ))
+
+
 def display_validation_results(results: dict):
     """Display validation results in a formatted table."""
     
-    console.print("[bold]Validation Results[/bold]\n")
-    
     table = Table(title="File Validation")
     table.add_column("File", style="cyan")
     table.add_column("Status", justify="center")
@@ -1160,15 +968,20 @@ def display_validation_results(results: dict):
         
         table.add_row(filename, status, records, issues_str)
     
-    console.print(table)
-    
     # Summary
     summary = results["summary"]
-    console.print(f"\n[bold]Summary:[/bold]")
-    console.print(f"Total files: {summary['total_files']}")
-    console.print(f"Passed: [green]{summary['passed']}[/green]")
-    console.print(f"Failed: [red]{summary['failed']}[/red]")
-    console.print(f"Total records: {summary['total_records']:,}")
+    
+    # Rendered and written in one console.print call; render_str applies the
+    # same markup and highlighting as printing each line separately
+    console.print(Group(
+        console.render_str("[bold]Validation Results[/bold]\n"),
+        table,
+        console.render_str(f"\n[bold]Summary:[/bold]"),
+        console.render_str(f"Total files: {summary['total_files']}"),
+        console.render_str(f"Passed: [green]{summary['passed']}[/green]"),
+        console.render_str(f"Failed: [red]{summary['failed']}[/red]"),
+        console.render_str(f"Total records: {summary['total_records']:,}"),
+    ))
 
 
 def check_data_files():
@@ -1180,13 +993,14 @@ def check_data_files():
         console.print("[red]✗ Data directory does not exist[/red]")
         return
     
-    csv_files = list(DATA_DIR.glob("*.csv"))
+    entries = scan_data_dir(DATA_DIR)
+    csv_files = [DATA_DIR / name for name in entries if name.endswith(".csv")]
     if csv_files:
         console.print(f"[green]✓ Found {len(csv_files)} CSV files[/green]")
         for file in csv_files[:5]:  # Show first 5 files
             try:
-                df = pd.read_csv(file)
-                console.print(f"  - {file.name}: {len(df):,} records")
+                n_rows = count_data_rows(select_data_file(file, entries)[0])
+                console.print(f"  - {file.name}: {n_rows:,} records")
             except:
                 console.print(f"  - {file.name}: Error reading file")
         
@@ -1203,18 +1017,20 @@ def check_api_server():
     
     console.print("[bold]API Server Status:[/bold]")
     
+    # Plain stdlib HTTP: importing requests would cost more than the check itself
+    conn = http.client.HTTPConnection("localhost", 8000, timeout=2)
     try:
-        import requests
-        response = requests.get("http://localhost:8000/health", timeout=2)
-        if response.status_code == 200:
+        conn.request("GET", "/health")
+        status_code = conn.getresponse().status
+        if status_code == 200:
             console.print("[green]✓ API server is running on http://localhost:8000[/green]")
             console.print(f"  - Documentation: http://localhost:8000/docs")
         else:
-            console.print(f"[yellow]⚠ API server responding with status {response.status_code}[/yellow]")
-    except ImportError:
-        console.print("[yellow]⚠ requests library not available to check server status[/yellow]")
-    except:
+            console.print(f"[yellow]⚠ API server responding with status {status_code}[/yellow]")
+    except (OSError, http.client.HTTPException):
         console.print("[red]✗ API server is not running[/red]")
+    finally:
+        conn.close()
     
     console.print()
 
@@ -0,0 +1,940 @@
+"""
+Setup wizard for the synthetic healthcare data system.
+Kept out of cli.py so that other commands never import the wizard code;
+the setup-wizard command in cli.py imports this module when it runs.
+"""
+
+import os
+import sys
+import subprocess
+import contextlib
+import functools
+import importlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional, List, Dict, Tuple
+from rich.console import Console
+from rich.markup import escape, render as render_markup
+from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.panel import Panel
+from rich.prompt import Prompt, Confirm, IntPrompt
+import platform
+import shutil
+
+console = Console()
+
+
+def run_wizard(auto: bool, method: Optional[str], patients: int):
+    """Run the setup wizard; called by the setup-wizard command in cli.py."""
+    
+    if auto:
+        run_auto_setup(method, patients)
+        return
+        
+    show_wizard_welcome()
+    
+    # Step 1: Environment Detection and Recommendations
+    env_info = detect_environment()
+    show_environment_info(env_info)
+    
+    # Step 2: Choose Setup Method
+    setup_method = choose_setup_method(env_info)
+    
+    # Step 3: Configure Based on Method
+    config = configure_setup(setup_method, env_info)
+    
+    # Step 4: Run Setup Process
+    success = run_setup_process(setup_method, config)
+    
+    # Step 5: Verification and Next Steps
+    if success:
+        show_success_message(setup_method, config)
+    else:
+        show_failure_message()
+
+
+WIZARD_WELCOME = (
+    "[bold blue]🏥 Welcome to the Healthcare Data System Setup Wizard![/bold blue]\n\n"
+    "This wizard will guide you through setting up your synthetic healthcare database\n"
+    "step-by-step. Perfect for beginners! ✨\n\n"
+    "[dim]We'll help you choose the best setup method, configure everything automatically,\n"
+    "and get you up and running with sample data and APIs.[/dim]"
+)
+
+
+def emit(renderable: Callable[[], object], plain: str):
+    """Print renderable() on a terminal, or just the plain text when output is redirected.
+    
+    renderable is a zero-argument callable so Panels and Tables are only built
+    when they will be shown.
+    """
+    if console.is_terminal:
+        console.print(renderable())
+    else:
+        console.out(plain, highlight=False)
+
+
+def emit_panel(message: str, fit: bool = False, **panel_kwargs):
+    """emit() a Panel of markup message; redirected output gets its title and plain text."""
+    plain = render_markup(message).plain
+    if panel_kwargs.get('title'):
+        plain = f"{panel_kwargs['title']}\n{plain}"
+    emit(lambda: (Panel.fit if fit else Panel)(message, **panel_kwargs), plain)
+
+
+def show_wizard_welcome():
+    emit_panel(WIZARD_WELCOME, fit=True, title="🧙 Setup Wizard", border_style="blue")
+
+
+def run_auto_setup(method: Optional[str], patients: int):
+    """Run automated setup with minimal user interaction."""
+    
+    message = (
+        "[bold green]🚀 Automated Setup Mode[/bold green]\n\n"
+        "Running quick setup with default settings...\n"
+        f"• Method: {method or 'api-only'}\n"
+        f"• Patients: {patients}"
+    )
+    emit_panel(message, border_style="green")
+    
+    env_info = detect_environment()
+    
+    # Choose method automatically based on environment or user preference
+    if not method:
+        if env_info['in_codespace']:
+            setup_method = 'codespace'
+        elif env_info['has_docker'] and env_info.get('has_docker_compose'):
+            setup_method = 'docker'
+        else:
+            setup_method = 'api_only'
+    else:
+        # Map method names
+        method_mapping = {
+            'api': 'api_only',
+            'docker': 'docker',
+            'native': 'native',
+            'gcp': 'gcp',
+            'codespace': 'codespace'
+        }
+        setup_method = method_mapping.get(method, 'api_only')
+    
+    # Configure with defaults
+    config = {
+        'method': setup_method,
+        'patients': patients,
+        'include_ed': True,
+        'include_ip': True,
+        'seed': 42
+    }
+    
+    console.print(f"\n[cyan]Selected method: {setup_method}[/cyan]")
+    
+    # Run setup
+    success = run_setup_process(setup_method, config)
+    
+    if success:
+        console.print("\n[bold green]✅ Automated setup completed successfully![/bold green]")
+        show_success_message(setup_method, config)
+    else:
+        console.print("\n[bold red]❌ Automated setup failed.[/bold red]")
+        console.print("Try running the interactive wizard: [cyan]python cli.py setup-wizard[/cyan]")
+
+
+def probe_version(cmd: List[str]) -> Optional[str]:
+    """Run a tool's version command and return its output, or None if it fails."""
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+@functools.lru_cache(maxsize=1)
+def detect_environment() -> Dict:
+    """Detect the current environment and available tools.
+    
+    Cached for the life of the process; callers must not modify the result.
+    """
+    env_info = {
+        'os': platform.system(),
+        'python_version': sys.version,
+        'has_docker': shutil.which('docker') is not None,
+        'has_mysql': False,
+        'has_git': shutil.which('git') is not None,
+        'in_codespace': os.environ.get('CODESPACES') == 'true',
+        'has_make': shutil.which('make') is not None,
+        'working_directory': os.getcwd()
+    }
+    
+    # Only spawn version probes for tools that are on PATH, and run them concurrently
+    probes = {}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if shutil.which('mysql'):
+            probes['mysql'] = executor.submit(probe_version, ['mysql', '--version'])
+        if env_info['has_docker']:
+            probes['docker_compose'] = executor.submit(probe_version, ['docker', 'compose', 'version'])
+    
+    mysql_version = probes['mysql'].result() if 'mysql' in probes else None
+    env_info['has_mysql'] = mysql_version is not None
+    if mysql_version is not None:
+        env_info['mysql_version'] = mysql_version
+    
+    env_info['has_docker_compose'] = (
+        'docker_compose' in probes and probes['docker_compose'].result() is not None
+    )
+    
+    return env_info
+
+
+def show_environment_info(env_info: Dict):
+    """Display environment detection results.
+    
+    When output is redirected, rows are printed as tab-separated feature/details pairs.
+    """
+    
+    python_version = env_info['python_version'].split()[0]
+    rows = [
+        ("Operating System", "ℹ️", env_info['os']),
+        ("Python Version", "✅", python_version),
+        # Tools availability
+        ("Docker", "✅" if env_info['has_docker'] else "❌",
+         "Available" if env_info['has_docker'] else "Not found"),
+        ("Docker Compose", "✅" if env_info.get('has_docker_compose') else "❌",
+         "Available" if env_info.get('has_docker_compose') else "Not available"),
+        ("MySQL Client", "✅" if env_info['has_mysql'] else "❌",
+         env_info.get('mysql_version', 'Not found')),
+        ("GitHub Codespace", "✅" if env_info['in_codespace'] else "❌",
+         "Yes" if env_info['in_codespace'] else "No"),
+    ]
+    
+    if not console.is_terminal:
+        console.out("\n".join(f"{feature}\t{details}" for feature, _, details in rows), highlight=False)
+        return
+    
+    console.print("\n[bold cyan]🔍 Environment Detection Results[/bold cyan]")
+    
+    # Create a table for environment info
+    table = Table(show_header=False, box=None, pad_edge=False)
+    table.add_column("Feature", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Details", style="dim")
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+
+
+# Setup methods offered by the wizard, in display order. 'available' filters
+# the list for the detected environment; any other callable field is resolved
+# against env_info each time the list is shown.
+_SETUP_METHODS: Tuple[Dict, ...] = (
+    {
+        'key': 'codespace',
+        'name': '🚀 GitHub Codespace (Recommended for you!)',
+        'description': 'Perfect for your current environment - everything is pre-configured',
+        'difficulty': 'Easy',
+        'time': '2-3 minutes',
+        'available': lambda env: env['in_codespace'],
+        'recommended': lambda env: True,
+    },
+    {
+        'key': 'docker',
+        'name': '🐳 Docker Compose (Great for local development)',
+        'description': 'Isolated environment with MySQL and API services',
+        'difficulty': 'Easy',
+        'time': '5-7 minutes',
+        'available': lambda env: env['has_docker'] and env.get('has_docker_compose'),
+        'recommended': lambda env: not env['in_codespace'],
+    },
+    {
+        'key': 'native',
+        'name': '⚡ Native Setup (Fastest if you have MySQL)',
+        'description': 'Use your local MySQL installation',
+        'difficulty': lambda env: 'Easy' if env['has_mysql'] else 'Medium',
+        'time': lambda env: '3-5 minutes' if env['has_mysql'] else '10-15 minutes',
+        'available': lambda env: True,
+        'recommended': lambda env: False,
+    },
+    {
+        'key': 'api_only',
+        'name': '📊 API Only (No database required)',
+        'description': 'Just generate data files and start the API server',
+        'difficulty': 'Easy',
+        'time': '1-2 minutes',
+        'available': lambda env: True,
+        'recommended': lambda env: False,
+    },
+    {
+        'key': 'gcp',
+        'name': '☁️ Google Cloud Platform (Advanced)',
+        'description': 'Deploy to GCP with managed MySQL',
+        'difficulty': 'Advanced',
+        'time': '20-30 minutes',
+        'available': lambda env: True,
+        'recommended': lambda env: False,
+    },
+)
+
+
+def choose_setup_method(env_info: Dict) -> str:
+    """Let user choose the setup method based on their environment."""
+    
+    console.print(f"\n[bold green]📋 Recommended Setup Methods[/bold green]")
+    
+    # Build recommendations based on environment
+    methods = [
+        {k: v(env_info) if callable(v) else v for k, v in method.items() if k != 'available'}
+        for method in _SETUP_METHODS if method['available'](env_info)
+    ]
+    
+    # Display options
+    for i, method in enumerate(methods, 1):
+        style = "bold green" if method['recommended'] else "white"
+        rec_text = " ⭐ RECOMMENDED" if method['recommended'] else ""
+        
+        panel_content = (f"[{style}]{method['name']}{rec_text}[/{style}]\n\n"
+                        f"{method['description']}\n\n"
+                        f"[dim]Difficulty: {method['difficulty']} | "
+                        f"Estimated time: {method['time']}[/dim]")
+        
+        emit_panel(panel_content,
+                   title=f"Option {i}",
+                   border_style="green" if method['recommended'] else "white")
+    
+    # Get user choice
+    while True:
+        choice = Prompt.ask(
+            "\n[bold yellow]Which setup method would you like to use?[/bold yellow]",
+            choices=[str(i) for i in range(1, len(methods) + 1)],
+            default="1" if methods[0]['recommended'] else None
+        )
+        
+        try:
+            selected_method = methods[int(choice) - 1]
+            console.print(f"\n[green]✅ You selected: {selected_method['name']}[/green]")
+            
+            if Confirm.ask("Is this correct?", default=True):
+                return selected_method['key']
+        except (ValueError, IndexError):
+            console.print("[red]Invalid choice. Please try again.[/red]")
+
+
+def configure_setup(setup_method: str, env_info: Dict) -> Dict:
+    """Configure the setup based on the chosen method."""
+    
+    console.print(f"\n[bold blue]⚙️ Configuration Setup[/bold blue]")
+    
+    config = {
+        'method': setup_method,
+        'patients': 1000,
+        'seed': 42,
+        'include_ed': True,
+        'include_ip': True,
+        'api_port': 8000
+    }
+    
+    if setup_method == 'codespace':
+        return configure_codespace(config)
+    elif setup_method == 'docker':
+        return configure_docker(config)
+    elif setup_method == 'native':
+        return configure_native(config, env_info)
+    elif setup_method == 'api_only':
+        return configure_api_only(config)
+    elif setup_method == 'gcp':
+        return configure_gcp(config)
+    
+    return config
+
+
+def configure_codespace(config: Dict) -> Dict:
+    """Configure for GitHub Codespace environment."""
+    emit_panel(
+        "[green]🚀 GitHub Codespace Configuration[/green]\n\n"
+        "Great news! Since you're in a Codespace, most configuration is automatic.\n"
+        "The devcontainer has already set up MySQL and all dependencies.\n\n"
+        "Let's configure your data generation preferences:",
+        border_style="green"
+    )
+    
+    config.update(get_data_preferences())
+    return config
+
+
+def configure_docker(config: Dict) -> Dict:
+    """Configure for Docker Compose setup."""
+    emit_panel(
+        "[blue]🐳 Docker Compose Configuration[/blue]\n\n"
+        "Docker Compose will create isolated containers for:\n"
+        "• MySQL database server\n"
+        "• Python application with all dependencies\n\n"
+        "Let's configure your preferences:",
+        border_style="blue"
+    )
+    
+    config.update(get_data_preferences())
+    
+    # Check if .env exists, offer to create it
+    if not Path('.env').exists():
+        if Confirm.ask("Create .env configuration file?", default=True):
+            create_env_file('docker')
+            console.print("[green]✅ Created .env file with Docker defaults[/green]")
+    
+    return config
+
+
+def configure_native(config: Dict, env_info: Dict) -> Dict:
+    """Configure for native MySQL setup."""
+    emit_panel(
+        "[yellow]⚡ Native MySQL Configuration[/yellow]\n\n"
+        "You'll use your local MySQL installation.\n"
+        "We'll help you configure the database connection.",
+        border_style="yellow"
+    )
+    
+    config.update(get_data_preferences())
+    config.update(get_mysql_config(env_info))
+    
+    return config
+
+
+def configure_api_only(config: Dict) -> Dict:
+    """Configure for API-only setup (no database)."""
+    emit_panel(
+        "[cyan]📊 API-Only Configuration[/cyan]\n\n"
+        "This mode generates data files (CSV) and starts the API server.\n"
+        "No database setup required - perfect for quick exploration!",
+        border_style="cyan"
+    )
+    
+    config.update(get_data_preferences())
+    return config
+
+
+def configure_gcp(config: Dict) -> Dict:
+    """Configure for Google Cloud Platform deployment."""
+    emit_panel(
+        "[red]☁️ Google Cloud Platform Configuration[/red]\n\n"
+        "⚠️  This is an advanced setup method that requires:\n"
+        "• GCP account with billing enabled\n"
+        "• gcloud CLI installed and configured\n"
+        "• Understanding of cloud costs\n\n"
+        "[bold]This will create real cloud resources that may incur charges![/bold]",
+        border_style="red"
+    )
+    
+    if not Confirm.ask("Do you want to continue with GCP setup?", default=False):
+        console.print("[yellow]Switching to Docker setup instead...[/yellow]")
+        return configure_docker(config)
+    
+    config.update(get_data_preferences())
+    config.update(get_gcp_config())
+    
+    return config
+
+
+def get_data_preferences() -> Dict:
+    """Get user preferences for data generation."""
+    console.print("\n[bold]📊 Data Generation Preferences[/bold]")
+    
+    # Number of patients
+    patients = IntPrompt.ask(
+        "How many synthetic patients would you like to generate?",
+        default=1000,
+        show_default=True
+    )
+    
+    if patients > 10000:
+        console.print("[yellow]⚠️  Large datasets (>10k patients) may take several minutes to generate.[/yellow]")
+        if not Confirm.ask("Continue with this size?", default=True):
+            patients = IntPrompt.ask("Enter a smaller number", default=1000)
+    
+    # Data types
+    include_ed = Confirm.ask("Include Emergency Department encounters?", default=True)
+    include_ip = Confirm.ask("Include Inpatient stays?", default=True)
+    
+    return {
+        'patients': patients,
+        'include_ed': include_ed,
+        'include_ip': include_ip
+    }
+
+
+def get_mysql_config(env_info: Dict) -> Dict:
+    """Get MySQL configuration from user."""
+    console.print("\n[bold]🔧 MySQL Database Configuration[/bold]")
+    
+    if not env_info['has_mysql']:
+        emit_panel(
+            "[red]⚠️  MySQL client not found![/red]\n\n"
+            "You'll need to install MySQL first. Here's how:\n\n"
+            "[bold]Ubuntu/Debian:[/bold] sudo apt install mysql-server mysql-client\n"
+            "[bold]macOS:[/bold] brew install mysql\n"
+            "[bold]Windows:[/bold] Download from https://dev.mysql.com/downloads/mysql/\n\n"
+            "Or consider using Docker Compose instead (easier!)",
+            border_style="red"
+        )
+        
+        if Confirm.ask("Switch to Docker Compose setup?", default=True):
+            return {'switch_to_docker': True}
+    
+    host = Prompt.ask("MySQL Host", default="localhost")
+    port = IntPrompt.ask("MySQL Port", default=3306)
+    user = Prompt.ask("MySQL User", default="root")
+    password = Prompt.ask("MySQL Password", password=True, default="")
+    database = Prompt.ask("Database Name", default="lm_synth")
+    
+    return {
+        'mysql_host': host,
+        'mysql_port': port,
+        'mysql_user': user,
+        'mysql_password': password,
+        'mysql_database': database
+    }
+
+
+def get_gcp_config() -> Dict:
+    """Get GCP configuration from user."""
+    console.print("\n[bold]☁️ Google Cloud Platform Configuration[/bold]")
+    
+    # Show GCP setup instructions
+    emit_panel(
+        "[bold blue]GCP Setup Instructions:[/bold blue]\n\n"
+        "1. Create a GCP project: https://console.cloud.google.com/projectcreate\n"
+        "2. Enable Cloud SQL Admin API: https://console.cloud.google.com/apis/library/sqladmin.googleapis.com\n"
+        "3. Create a service account with Cloud SQL Admin role\n"
+        "4. Download the service account JSON key file\n"
+        "5. Install gcloud CLI: https://cloud.google.com/sdk/docs/install\n\n"
+        "[yellow]💰 Cost estimate: ~$20-50/month for a small instance[/yellow]",
+        title="📋 Prerequisites",
+        border_style="blue"
+    )
+    
+    project_id = Prompt.ask("GCP Project ID")
+    region = Prompt.ask("GCP Region", default="us-central1")
+    instance_name = Prompt.ask("Cloud SQL Instance Name", default="healthcare-db")
+    
+    # Service account key
+    key_file = Prompt.ask("Path to service account JSON key file")
+    if not Path(key_file).exists():
+        console.print("[red]❌ Key file not found. Please check the path.[/red]")
+        return get_gcp_config()  # Retry
+    
+    return {
+        'gcp_project': project_id,
+        'gcp_region': region,
+        'gcp_instance': instance_name,
+        'gcp_key_file': key_file
+    }
+
+
+def create_env_file(setup_type: str):
+    """Create .env file based on setup type."""
+    if setup_type == 'docker':
+        env_content = """# Docker Compose Configuration
+MYSQL_HOST=mysql
+MYSQL_PORT=3306
+MYSQL_USER=root
+MYSQL_PASSWORD=healthcare123
+MYSQL_DATABASE=lm_synth
+MYSQL_ROOT_PASSWORD=healthcare123
+
+# API Configuration
+API_HOST=0.0.0.0
+API_PORT=8000
+"""
+    else:
+        env_content = """# Native MySQL Configuration
+MYSQL_HOST=localhost
+MYSQL_PORT=3306
+MYSQL_USER=root
+MYSQL_PASSWORD=
+MYSQL_DATABASE=lm_synth
+
+# API Configuration  
+API_HOST=localhost
+API_PORT=8000
+"""
+    
+    with open('.env', 'w') as f:
+        f.write(env_content)
+
+
+def run_setup_process(setup_method: str, config: Dict) -> bool:
+    """Execute the setup process based on method and configuration."""
+    
+    console.print(f"\n[bold green]🚀 Starting Setup Process[/bold green]")
+    
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            
+            if setup_method == 'codespace':
+                return run_codespace_setup(config, progress)
+            elif setup_method == 'docker':
+                return run_docker_setup(config, progress)
+            elif setup_method == 'native':
+                return run_native_setup(config, progress)
+            elif setup_method == 'api_only':
+                return run_api_only_setup(config, progress)
+            elif setup_method == 'gcp':
+                return run_gcp_setup(config, progress)
+                
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠️ Setup interrupted by user.[/yellow]")
+        return False
+    except Exception as e:
+        console.print(f"\n[red]❌ Setup failed: {str(e)}[/red]")
+        return False
+    
+    return False
+
+
+def run_codespace_setup(config: Dict, progress) -> bool:
+    """Run setup for GitHub Codespace."""
+    
+    task1 = progress.add_task("Installing dependencies...", total=None)
+    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
+        return False
+    progress.update(task1, completed=100)
+    
+    task2 = progress.add_task("Generating sample data...", total=None)
+    if not run_main_in_process("generate_data", build_generate_argv(config)):
+        return False
+    progress.update(task2, completed=100)
+    
+    task3 = progress.add_task("Setting up database...", total=None)
+    if not run_main_in_process("load_data", []):
+        return False
+    progress.update(task3, completed=100)
+    
+    return True
+
+
+def run_docker_setup(config: Dict, progress) -> bool:
+    """Run setup for Docker Compose."""
+    
+    task1 = progress.add_task("Starting Docker containers...", total=None)
+    if not run_command_with_progress("docker compose up -d", progress, task1):
+        return False
+    progress.update(task1, completed=100)
+    
+    # Wait for MySQL to be ready
+    task2 = progress.add_task("Waiting for MySQL to be ready...", total=None)
+    if not wait_for_mysql_docker(progress, task2):
+        return False
+    progress.update(task2, completed=100)
+    
+    task3 = progress.add_task("Installing dependencies in container...", total=None)
+    if not run_command_with_progress("docker compose exec -T app pip install -r requirements.txt", progress, task3):
+        return False
+    progress.update(task3, completed=100)
+    
+    task4 = progress.add_task("Generating sample data...", total=None)
+    cmd = f"docker compose exec -T app {build_generate_command(config)}"
+    if not run_command_with_progress(cmd, progress, task4):
+        return False
+    progress.update(task4, completed=100)
+    
+    task5 = progress.add_task("Loading data into database...", total=None)
+    if not run_command_with_progress("docker compose exec -T app python load_data.py", progress, task5):
+        return False
+    progress.update(task5, completed=100)
+    
+    return True
+
+
+def run_native_setup(config: Dict, progress) -> bool:
+    """Run setup for native MySQL."""
+    
+    if config.get('switch_to_docker'):
+        console.print("[yellow]Switching to Docker setup...[/yellow]")
+        return run_docker_setup(config, progress)
+    
+    task1 = progress.add_task("Installing dependencies...", total=None)
+    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
+        return False
+    progress.update(task1, completed=100)
+    
+    task2 = progress.add_task("Creating database schema...", total=None)
+    create_cmd = f"mysql -h {config['mysql_host']} -P {config['mysql_port']} -u {config['mysql_user']}"
+    if config['mysql_password']:
+        create_cmd += f" -p{config['mysql_password']}"
+    create_cmd += f" -e \"CREATE DATABASE IF NOT EXISTS {config['mysql_database']} CHARACTER SET utf8mb4 COLLATE utf8mb4_0900_ai_ci;\""
+    
+    if not run_command_with_progress(create_cmd, progress, task2):
+        return False
+    
+    # Load schema
+    schema_cmd = f"mysql -h {config['mysql_host']} -P {config['mysql_port']} -u {config['mysql_user']}"
+    if config['mysql_password']:
+        schema_cmd += f" -p{config['mysql_password']}"
+    schema_cmd += f" {config['mysql_database']} < schema.sql"
+    
+    if not run_command_with_progress(schema_cmd, progress, task2):
+        return False
+    progress.update(task2, completed=100)
+    
+    task3 = progress.add_task("Generating sample data...", total=None)
+    if not run_main_in_process("generate_data", build_generate_argv(config)):
+        return False
+    progress.update(task3, completed=100)
+    
+    task4 = progress.add_task("Loading data into database...", total=None)
+    load_argv = [
+        "--host", str(config['mysql_host']),
+        "--port", str(config['mysql_port']),
+        "--user", str(config['mysql_user']),
+    ]
+    if config['mysql_password']:
+        load_argv += ["--password", str(config['mysql_password'])]
+    
+    if not run_main_in_process("load_data", load_argv):
+        return False
+    progress.update(task4, completed=100)
+    
+    return True
+
+
+def run_api_only_setup(config: Dict, progress) -> bool:
+    """Run setup for API-only mode."""
+    
+    task1 = progress.add_task("Installing dependencies...", total=None)
+    if not run_command_with_progress("pip install -r requirements.txt", progress, task1):
+        return False
+    progress.update(task1, completed=100)
+    
+    task2 = progress.add_task("Generating sample data files...", total=None)
+    if not run_main_in_process("generate_data", build_generate_argv(config)):
+        return False
+    progress.update(task2, completed=100)
+    
+    return True
+
+
+def run_gcp_setup(config: Dict, progress) -> bool:
+    """Run setup for Google Cloud Platform."""
+    
+    # This is a simplified version - full GCP setup would be quite complex
+    console.print("[yellow]⚠️  GCP setup is complex and not fully implemented in this wizard.[/yellow]")
+    console.print("Please refer to the GCP documentation for manual setup.")
+    return False
+
+
+def build_generate_argv(config: Dict) -> List[str]:
+    """Build the generate_data.py arguments based on config."""
+    argv = ["--patients", str(config['patients'])]
+    
+    if not config.get('include_ed', True):
+        argv.append("--no-ed")
+    if not config.get('include_ip', True):
+        argv.append("--no-ip")
+    
+    return argv
+
+
+def build_generate_command(config: Dict) -> str:
+    """Build the data generation command based on config."""
+    return " ".join(["python generate_data.py", *build_generate_argv(config)])
+
+
+def run_main_in_process(module_name: str, argv: List[str]) -> bool:
+    """Run one of the repo's scripts (generate_data, load_data) by calling its main(argv).
+    
+    Used instead of run_command_with_progress for scripts in this repo, so each
+    step skips interpreter start-up and re-importing pandas. Output is
+    discarded, as with the subprocess runner. Docker and mysql steps still run
+    as commands.
+    """
+    try:
+        # pip may have installed the script's dependencies since start-up
+        importlib.invalidate_caches()
+        entry_point = importlib.import_module(module_name).main
+        with contextlib.redirect_stdout(io.StringIO()):
+            return not entry_point(argv)
+    except SystemExit as e:
+        return not e.code
+    except Exception as e:
+        console.print(f"\n[red]⚠️ {module_name} failed: {str(e)}[/red]")
+        return False
+
+
+COMMAND_TIMEOUT = 300  # seconds
+
+
+def run_command_with_progress(command: str, progress, task_id) -> bool:
+    """Run a command, showing its latest output line as the task description.
+    
+    Output is streamed rather than captured, so nothing accumulates in memory
+    during long steps such as pip install. The command is killed after
+    COMMAND_TIMEOUT seconds.
+    """
+    description = next(task.description for task in progress.tasks if task.id == task_id)
+    try:
+        proc = subprocess.Popen(
+            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1
+        )
+    except Exception as e:
+        console.print(f"\n[red]⚠️ Command failed: {str(e)}[/red]")
+        return False
+    
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    # A timer rather than proc.wait(timeout=...) so a command that stops
+    # producing output is still killed while we block reading it
+    timer = threading.Timer(COMMAND_TIMEOUT, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                progress.update(task_id, description=f"{description} [dim]{escape(line[:60])}[/dim]")
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        progress.update(task_id, description=description)
+    
+    if timed_out.is_set():
+        console.print(f"\n[red]⚠️ Command timed out: {command}[/red]")
+        return False
+    return returncode == 0
+
+
+MYSQL_WAIT_TIMEOUT = 30  # seconds
+
+
+def wait_for_mysql_docker(progress, task_id) -> bool:
+    """Wait for MySQL to be ready in Docker.
+    
+    mysqladmin --wait retries the ping inside the container, so a single
+    docker compose exec normally covers the whole wait. The retry count is
+    bounded by the time left, so the ping also stops on the server side if the
+    local timeout kills the exec client. The exec is only re-run, with
+    exponential backoff, if it fails early (e.g. the container is still starting).
+    """
+    import time
+    
+    deadline = time.monotonic() + MYSQL_WAIT_TIMEOUT
+    delay = 0.1
+    
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        cmd = [
+            "docker", "compose", "exec", "-T", "mysql",
+            "mysqladmin", "ping", "-h", "localhost", "--silent",
+            "--connect-timeout=1", f"--wait={max(int(remaining), 1)}",
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=remaining)
+            if result.returncode == 0:
+                return True
+        except subprocess.TimeoutExpired:
+            return False
+        except OSError:
+            pass
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 2.0)
+
+
+def show_success_message(setup_method: str, config: Dict):
+    """Show success message and next steps."""
+    
+    emit_panel(
+        "[bold green]🎉 Setup Complete! 🎉[/bold green]\n\n"
+        "Your synthetic healthcare database is ready to use!\n\n"
+        f"[dim]Setup method: {setup_method}[/dim]\n"
+        f"[dim]Generated {config['patients']} synthetic patients[/dim]",
+        title="✅ Success",
+        border_style="green"
+    )
+    
+    # Show next steps based on setup method
+    next_steps = get_next_steps(setup_method, config)
+    
+    console.print(f"\n[bold cyan]🚀 What's Next?[/bold cyan]")
+    for step in next_steps:
+        console.print(f"• {step}")
+    
+    # Show useful commands
+    console.print(f"\n[bold yellow]🔧 Useful Commands:[/bold yellow]")
+    console.print("• [cyan]python cli.py status[/cyan] - Check system status")
+    console.print("• [cyan]python cli.py validate[/cyan] - Validate generated data")
+    console.print("• [cyan]python cli.py clean[/cyan] - Clean up generated files")
+    
+    if setup_method in ['codespace', 'native']:
+        console.print("• [cyan]python -m uvicorn main_api:app --reload[/cyan] - Start API server")
+    elif setup_method == 'docker':
+        console.print("• [cyan]docker compose logs[/cyan] - View container logs")
+        console.print("• [cyan]docker compose down[/cyan] - Stop all containers")
+
+
+def get_next_steps(setup_method: str, config: Dict) -> List[str]:
+    """Get next steps based on setup method."""
+    
+    if setup_method == 'codespace':
+        return [
+            "Access the API documentation at the forwarded port URL",
+            "Try sample queries in the MySQL database",
+            "Explore the generated data files in the ./data/ directory",
+            "Use the CLI commands to manage your data"
+        ]
+    
+    elif setup_method == 'docker':
+        return [
+            "Visit http://localhost:8000/docs for API documentation",
+            "Connect to MySQL: docker compose exec mysql mysql -u root -p lm_synth",
+            "View container logs: docker compose logs",
+            "Explore data files: ls -la data/"
+        ]
+    
+    elif setup_method == 'native':
+        return [
+            f"Connect to MySQL: mysql -h {config['mysql_host']} -u {config['mysql_user']} -p {config['mysql_database']}",
+            "Start API server: python -m uvicorn main_api:app --reload",
+            "Visit http://localhost:8000/docs for API documentation",
+            "Explore data files: ls -la data/"
+        ]
+    
+    elif setup_method == 'api_only':
+        return [
+            "Start API server: python -m uvicorn main_api:app --reload",
+            "Visit http://localhost:8000/docs for API documentation", 
+            "Explore generated CSV files: ls -la data/",
+            "No database setup required - data is served from files"
+        ]
+    
+    return ["Check the documentation for more information"]
+
+
+def show_failure_message():
+    """Show failure message with troubleshooting tips."""
+    
+    emit_panel(
+        "[bold red]❌ Setup Failed[/bold red]\n\n"
+        "Don't worry! Here are some common solutions:\n\n"
+        "🔍 [bold]Troubleshooting Steps:[/bold]\n"
+        "1. Check your internet connection\n"
+        "2. Ensure you have sufficient disk space (>1GB)\n"
+        "3. Try running with elevated privileges if needed\n"
+        "4. Check for firewall or antivirus interference\n\n"
+        "📞 [bold]Need Help?[/bold]\n"
+        "• Check the README.md for detailed setup instructions\n"
+        "• Review the troubleshooting section\n"
+        "• Try a different setup method (e.g., Docker instead of native)\n"
+        "• Run [cyan]python cli.py status[/cyan] to diagnose issues",
+        title="🚨 Setup Failed",
+        border_style="red"
+    )
@@ -5,7 +5,7 @@ CSV-based repository implementation for testing.
 
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class CSVReferenceRepository:
@@ -158,6 +158,28 @@ class CSVScenarioRepository:
         
         return result.to_dict('records')
     
+    async def get_site_program_inputs(
+        self, site_ids: List[int], program_ids: List[int], baseline_year: int,
+        schedule_code: str = "Sched-A"
+    ) -> List[Dict[str, Any]]:
+        """Get baseline clinical parameters joined with staffed beds."""
+        rows = []
+        for program_id in dict.fromkeys(program_ids):
+            rows.extend(await self.get_site_program_baseline(site_ids, program_id, baseline_year))
+        baselines = pd.DataFrame(rows)
+        if baselines.empty:
+            return []
+        beds_df = pd.read_csv(self.data_dir / "staffed_beds_schedule.csv")
+        beds_df = beds_df[beds_df['schedule_code'] == schedule_code]
+
+        # Inner join: only sites with both a baseline and a staffed-beds row
+        result = baselines.merge(
+            beds_df[['site_id', 'program_id', 'staffed_beds']],
+            on=['site_id', 'program_id']
+        )
+
+        return result.to_dict('records')
+    
     async def get_site_staffed_beds(
         self, site_ids: List[int], program_id: int, schedule_code: str = "Sched-A"
     ) -> List[Dict[str, Any]]:
@@ -193,6 +215,18 @@ class CSVScenarioRepository:
             return filtered.iloc[0].to_dict()
         return None
     
+    async def get_monthly_seasonality_by_site(
+        self, site_ids: Tuple[int, ...], program_id: int
+    ) -> Dict[int, List[float]]:
+        """Get the 12 monthly seasonality multipliers for each site."""
+        return {
+            site_id: [
+                await self.get_seasonality_multiplier(site_id, program_id, month)
+                for month in range(1, 13)
+            ]
+            for site_id in site_ids
+        }
+    
     async def get_seasonality_multiplier(
         self, site_id: Optional[int] = None, program_id: Optional[int] = None, month: int = 1
     ) -> float:
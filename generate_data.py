@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import random
 import uuid
 import os
+import argparse
 
 # Set random seeds for reproducibility
 np.random.seed(42)
@@ -93,9 +94,9 @@ AGE_GROUPS = ["0-4", "5-14", "15-24", "25-44", "45-64", "65-74", "75-84", "85+"]
 GENDERS = ["Female", "Male", "Other"]
 ED_SUBSERVICES = ["Adult ED", "Pediatric ED", "Urgent Care Centre"]
 
-def create_output_dir():
+def create_output_dir(output_dir="data"):
     """Create output directory for CSV files"""
-    os.makedirs("data", exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
 def generate_dim_site():
     """Generate facility dimension data"""
@@ -384,54 +385,85 @@ def generate_ip_stays(patients_df, n_stays_per_patient=1):
     
     return pd.DataFrame(data)
 
-def main():
-    """Generate all sample data and save to CSV files"""
+def parse_args(argv=None):
+    """Parse command line options (the ones passed by cli.py generate)"""
+    parser = argparse.ArgumentParser(description="Generate synthetic healthcare data")
+    parser.add_argument("--patients", type=int, default=1000, help="Number of patients to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
+    parser.add_argument("--output", default="data", help="Output directory")
+    parser.add_argument("--no-ed", action="store_true", help="Skip ED encounters")
+    parser.add_argument("--no-ip", action="store_true", help="Skip IP stays")
+    return parser.parse_args(argv)
+
+def generate_iter(argv=None):
+    """Generate the tables in order, writing each CSV as soon as it is built.
+
+    Yields (path, dataframe) after each file is written, so a caller can
+    process file K while file K+1 is being generated (see cli.py pipeline).
+    Uses the same options and seeding as main().
+    """
+    args = parse_args(argv)
+    # Re-seed on every call so in-process runs match a fresh interpreter
+    np.random.seed(args.seed)
+    random.seed(args.seed)
+    Faker.seed(args.seed)
+
     print("Generating synthetic healthcare data...")
-    create_output_dir()
+    create_output_dir(args.output)
+
+    def save(name, df):
+        path = os.path.join(args.output, name)
+        df.to_csv(path, index=False)
+        return path, df
     
     # Generate dimension tables
     print("Creating dimension tables...")
-    dim_site = generate_dim_site()
-    dim_program = generate_dim_program()
-    dim_subprogram = generate_dim_subprogram()
-    dim_lha = generate_dim_lha()
+    yield save("dim_site.csv", generate_dim_site())
+    yield save("dim_program.csv", generate_dim_program())
+    yield save("dim_subprogram.csv", generate_dim_subprogram())
+    yield save("dim_lha.csv", generate_dim_lha())
     
     # Generate reference tables
     print("Creating population and rates tables...")
-    population_projection = generate_population_projection()
-    ed_baseline_rates = generate_ed_baseline_rates()
+    yield save("population_projection.csv", generate_population_projection())
+    yield save("ed_baseline_rates.csv", generate_ed_baseline_rates())
     
     # Generate patient data
     print("Creating patient data...")
-    patients = generate_patients(n_patients=1000)  # Start with 1000 patients
+    patients = generate_patients(n_patients=args.patients)
+    yield save("patients.csv", patients)
     
     # Generate encounter data
     print("Creating encounters...")
-    ed_encounters = generate_ed_encounters(patients)
-    ip_stays = generate_ip_stays(patients)
-    
-    # Save all data to CSV
-    print("Saving data to CSV files...")
-    dim_site.to_csv("data/dim_site.csv", index=False)
-    dim_program.to_csv("data/dim_program.csv", index=False)
-    dim_subprogram.to_csv("data/dim_subprogram.csv", index=False)
-    dim_lha.to_csv("data/dim_lha.csv", index=False)
-    population_projection.to_csv("data/population_projection.csv", index=False)
-    ed_baseline_rates.to_csv("data/ed_baseline_rates.csv", index=False)
-    patients.to_csv("data/patients.csv", index=False)
-    ed_encounters.to_csv("data/ed_encounters.csv", index=False)
-    ip_stays.to_csv("data/ip_stays.csv", index=False)
+    if not args.no_ed:
+        yield save("ed_encounters.csv", generate_ed_encounters(patients))
+    if not args.no_ip:
+        yield save("ip_stays.csv", generate_ip_stays(patients))
+
+def main(argv=None):
+    """Generate all sample data and save to CSV files.
+
+    argv defaults to sys.argv[1:]. Returns 0 on success so callers such as
+    cli.py can run it in-process instead of in a subprocess.
+    """
+    counts = {os.path.basename(path): len(df) for path, df in generate_iter(argv)}
     
-    print(f"Generated {len(dim_site)} facilities")
-    print(f"Generated {len(dim_program)} programs")
-    print(f"Generated {len(dim_subprogram)} subprograms")
-    print(f"Generated {len(dim_lha)} LHAs")
-    print(f"Generated {len(population_projection)} population records")
-    print(f"Generated {len(ed_baseline_rates)} ED rate records")
-    print(f"Generated {len(patients)} patients")
-    print(f"Generated {len(ed_encounters)} ED encounters")
-    print(f"Generated {len(ip_stays)} IP stays")
+    labels = [
+        ("dim_site.csv", "facilities"),
+        ("dim_program.csv", "programs"),
+        ("dim_subprogram.csv", "subprograms"),
+        ("dim_lha.csv", "LHAs"),
+        ("population_projection.csv", "population records"),
+        ("ed_baseline_rates.csv", "ED rate records"),
+        ("patients.csv", "patients"),
+        ("ed_encounters.csv", "ED encounters"),
+        ("ip_stays.csv", "IP stays"),
+    ]
+    for filename, label in labels:
+        if filename in counts:
+            print(f"Generated {counts[filename]} {label}")
     print("Data generation complete!")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
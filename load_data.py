@@ -107,7 +107,12 @@ def verify_data(engine):
     except Exception as e:
         print(f"Error during verification: {e}")
 
-def main():
+def main(argv=None):
+    """Load the CSV files into MySQL.
+
+    argv defaults to sys.argv[1:]. Returns the exit code so cli.py can run
+    it in-process.
+    """
     parser = argparse.ArgumentParser(description="Load synthetic healthcare data into MySQL")
     parser.add_argument("--host", default="localhost", help="MySQL host")
     parser.add_argument("--port", type=int, default=3306, help="MySQL port")
@@ -116,7 +121,7 @@ def main():
     parser.add_argument("--database", default="lm_synth", help="MySQL database")
     parser.add_argument("--data-dir", default="data", help="Directory containing CSV files")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Create database connection
     engine = create_mysql_engine(
@@ -128,12 +133,12 @@ def main():
     )
     
     if not engine:
-        sys.exit(1)
+        return 1
     
     # Check if data directory exists
     if not os.path.exists(args.data_dir):
         print(f"Data directory '{args.data_dir}' not found. Run generate_data.py first.")
-        sys.exit(1)
+        return 1
     
     # Load tables in dependency order (dimensions first, then facts)
     tables_to_load = [
@@ -160,6 +165,7 @@ def main():
         verify_data(engine)
     
     print("Data loading complete!")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
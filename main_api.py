@@ -13,8 +13,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from api_models import (
-    # Enums
-    AgeGroup, Gender, EDSubservice, Acuity, Disposition,
     # Dimension models (Instruction 01)
     DimSite, DimProgram, DimSubprogram, DimLHA,
     # Population models (Instruction 02)
@@ -244,8 +242,8 @@ async def get_population_projections(
         projections.append(PopulationProjection(
             year=int(row['year']),
             lha_id=int(row['lha_id']),
-            age_group=AgeGroup(row['age_group']),
-            gender=Gender(row['gender']),
+            age_group=row['age_group'],
+            gender=row['gender'],
             population=int(row['population'])
         ))
     
@@ -271,9 +269,9 @@ async def get_ed_baseline_rates(
     for _, row in paginated_df.iterrows():
         rates.append(EDBaselineRate(
             lha_id=int(row['lha_id']),
-            age_group=AgeGroup(row['age_group']),
-            gender=Gender(row['gender']),
-            ed_subservice=EDSubservice(row['ed_subservice']),
+            age_group=row['age_group'],
+            gender=row['gender'],
+            ed_subservice=row['ed_subservice'],
             baserate_per_1000=float(row['baserate_per_1000'])
         ))
     
@@ -305,11 +303,11 @@ async def get_patients(
         patients.append(Patient(
             patient_id=row['patient_id'],
             dob=dob,
-            age_group=AgeGroup(row['age_group']),
-            gender=Gender(row['gender']),
+            age_group=row['age_group'],
+            gender=row['gender'],
             lha_id=int(row['lha_id']),
             facility_home_id=int(row['facility_home_id']),
-            primary_ed_subservice=EDSubservice(row['primary_ed_subservice']),
+            primary_ed_subservice=row['primary_ed_subservice'],
             ed_visits_year=int(row['ed_visits_year'])
         ))
     
@@ -345,10 +343,10 @@ async def get_ed_encounters(
             encounter_id=int(row['encounter_id']),
             patient_id=row['patient_id'],
             facility_id=int(row['facility_id']),
-            ed_subservice=EDSubservice(row['ed_subservice']),
+            ed_subservice=row['ed_subservice'],
             arrival_timestamp=arrival_timestamp,
-            acuity=Acuity(int(row['acuity'])),
-            disposition=Disposition(row['dispo'])
+            acuity=int(row['acuity']),
+            disposition=row['dispo']
         ))
     
     return APIResponse(
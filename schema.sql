@@ -104,5 +104,7 @@ CREATE TABLE ip_stays (
   CONSTRAINT fk_ip_prog FOREIGN KEY (program_id) REFERENCES dim_program(program_id),
   CONSTRAINT fk_ip_subprog FOREIGN KEY (program_id, subprogram_id) REFERENCES dim_subprogram(program_id, subprogram_id),
   INDEX idx_ip_patient (patient_id),
-  INDEX idx_ip_admit (admit_ts)
+  INDEX idx_ip_admit (admit_ts),
+  -- Covers the scenario baseline-admissions aggregate (index-only scan)
+  INDEX idx_ip_prog_admit (program_id, admit_ts, facility_id, los_days, alc_flag)
 ) ENGINE=InnoDB;
\ No newline at end of file
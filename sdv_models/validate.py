@@ -489,8 +489,12 @@ class HealthcareDataValidator:
         return results
 
 
-def main():
-    """Main validation script."""
+def main(argv=None):
+    """Main validation script.
+    
+    argv defaults to sys.argv[1:]. Returns the exit code (1 if validation
+    failed) so cli.py can call it in-process.
+    """
     parser = argparse.ArgumentParser(description="Validate synthetic healthcare data")
     parser.add_argument("--real-data-dir", default="data", 
                        help="Directory containing real/seed CSV data files")
@@ -501,7 +505,7 @@ def main():
     parser.add_argument("--strict", action='store_true',
                        help="Use stricter validation thresholds")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Load data
     real_data_dir = Path(args.real_data_dir)
@@ -531,7 +535,7 @@ def main():
     
     if not real_data or not synthetic_data:
         logger.error("Could not load data files. Check paths.")
-        return
+        return 0
     
     # Setup validator
     thresholds = None
@@ -562,8 +566,9 @@ def main():
     
     # Exit with error code if validation failed
     if not validation_results['overall_pass']:
-        exit(1)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+
+from api import cache
+
+
+def test_cached_serves_stale_and_refreshes():
+    cache.clear_cache()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        first = await cache.cached('k', 60, load)
+        second = await cache.cached('k', 60, load)
+        assert first == second == 1
+        assert len(calls) == 1
+
+        # Age the entry past its TTL: the stale value is returned immediately
+        ts, value = cache._cache['k']
+        cache._cache['k'] = (ts - 120, value)
+        stale = await cache.cached('k', 60, load)
+        assert stale == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache.cached('k', 60, load) == 2
+
+    asyncio.run(run())
+    cache.clear_cache()
+
+
+def test_cached_does_not_store_failures():
+    cache.clear_cache()
+
+    async def boom():
+        raise RuntimeError('db down')
+
+    async def ok():
+        return ['row']
+
+    async def run():
+        try:
+            await cache.cached('k', 60, boom)
+            assert False, 'expected the loader error to propagate'
+        except RuntimeError:
+            pass
+        assert await cache.cached('k', 60, ok) == ['row']
+
+    asyncio.run(run())
+    cache.clear_cache()
+
+
+def test_async_ttl_cache_memoizes_per_arguments():
+    cache.clear_cache()
+    calls = []
+
+    @cache.async_ttl_cache(ttl=60)
+    async def lookup(program_id):
+        calls.append(program_id)
+        return {'program_id': program_id}
+
+    async def run():
+        assert await lookup(1) == {'program_id': 1}
+        assert await lookup(1) == {'program_id': 1}
+        assert await lookup(2) == {'program_id': 2}
+        assert calls == [1, 2]
+        assert cache.clear_cache() == 2
+        await lookup(1)
+        assert calls == [1, 2, 1]
+
+    asyncio.run(run())
+    cache.clear_cache()
+
+
+def test_reference_endpoint_etag_revalidation(monkeypatch):
+    from fastapi.testclient import TestClient
+    import api.main as api_main
+
+    class StubReferenceRepository:
+        async def get_programs(self):
+            return [{'program_id': 1, 'program_name': 'Medicine'}]
+
+    cache.clear_cache()
+    monkeypatch.setattr(api_main, 'ref_repo', StubReferenceRepository())
+    client = TestClient(api_main.app)
+
+    first = client.get('/reference/programs')
+    assert first.status_code == 200
+    etag = first.headers['etag']
+    assert first.headers['cache-control'].startswith('public, max-age=')
+
+    revalidated = client.get('/reference/programs', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b''
+    assert revalidated.headers['etag'] == etag
+
+    changed = client.get('/reference/programs', headers={'If-None-Match': '"stale"'})
+    assert changed.status_code == 200
+    assert changed.json()['data'] == [{'program_id': 1, 'program_name': 'Medicine'}]
+    cache.clear_cache()
+
+
+def test_ttl_cache_expires_evicts_and_flushes():
+    cache.clear_cache()
+    ttl_cache = cache.TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set('a', 1)
+    ttl_cache.set('b', 2)
+    ttl_cache.set('c', 3)
+    # Oldest entry is evicted once maxsize is exceeded
+    assert ttl_cache.get('a') is None
+    assert ttl_cache.get('b') == 2
+
+    # Expired entries are dropped rather than served
+    ts, value = ttl_cache._data['b']
+    ttl_cache._data['b'] = (ts - 120, value)
+    assert ttl_cache.get('b') is None
+    assert len(ttl_cache) == 1
+
+    assert cache.clear_cache() == 1
+    assert ttl_cache.get('c') is None
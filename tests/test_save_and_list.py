@@ -62,6 +62,14 @@ def test_save_and_list_flow(tmp_path):
         ids = [e['id'] for e in listing['data']]
         assert save_id in ids
 
+        # Full payload is fetched per id
+        r3 = requests.get(f'{base}/scenarios/saved/{save_id}', timeout=5)
+        assert r3.status_code == 200
+        assert r3.json()['data']['payload'] == payload
+
+        r4 = requests.get(f'{base}/scenarios/saved/not-an-id', timeout=5)
+        assert r4.status_code == 404
+
     finally:
         try:
             os.chdir(oldcwd)